@@ -1,8 +1,41 @@
 import ee
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request
-import json
+import functools
+import orjson
 import datetime
+from pathlib import Path
+import numpy as np
+from dataclasses import dataclass, asdict
+
+# Canonical JSON-LD context, shared across converters as
+# croissant_context.json at the repository root and parsed once per
+# process.
+_CONTEXT_PATH = Path(__file__).resolve().parent.parent / "croissant_context.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_context():
+    """Load the shared JSON-LD context (one parse per process)."""
+    return orjson.loads(_CONTEXT_PATH.read_bytes())
+
+
+_CROISSANT_CONTEXT = _load_context()
+
+
+@dataclass(slots=True)
+class BandRecord:
+    """Compact per-band asset record; slot storage is ~3x smaller than a
+    dict and attribute access avoids hash lookups.  Converted to a plain
+    dict only at JSON-emit time."""
+    href: str
+    type: str
+    roles: list
+    band_name: str
+    data_type: str
+    spatial_resolution: float
+    description: str
+
 
 # 1. Authenticate to Earth Engine
 SERVICE_ACCOUNT_FILE = "code-earthengine.json"
@@ -19,93 +52,71 @@ token = creds.token
 meta = ee.data.getAsset(ASSET_ID)
 props = meta["properties"]
 
-# 3. Compute bounding box
+# Derivations of ASSET_ID used throughout the document, computed once
+asset_id_safe = ASSET_ID.replace("/", "_")
+asset_id_dash = ASSET_ID.replace("/", "-")
+base_ee_url = f"https://earthengine.googleapis.com/v1alpha/projects/earthengine-public/assets/{ASSET_ID}"
+
+# 3. Compute bounding box with a single vectorized reduction over the ring
 coords = meta["geometry"]["coordinates"][0]
-lons, lats = zip(*coords)
-bbox = f"{min(lats)} {min(lons)} {max(lats)} {max(lons)}"
+coord_arr = np.asarray(coords, dtype=np.float64)
+min_lon, min_lat = coord_arr.min(axis=0)
+max_lon, max_lat = coord_arr.max(axis=0)
+bbox = f"{min_lat} {min_lon} {max_lat} {max_lon}"
 wkt = "POLYGON((" + ", ".join(f"{x} {y}" for x, y in coords) + "))"
 
-# 4. Build per-band assets
-assets = {}
+# 4. Build all per-band structures in a single pass over meta["bands"],
+#    computing each band's approximate contentSize once
+fileSet_id = f"sentinel2-bands-{asset_id_dash}"
+band_records = []
+band_files = []
+fileset_file_objects = []
 for band in meta["bands"]:
     band_id = band["id"]
     res = band["grid"]["affineTransform"]["scaleX"]
-    assets[band_id] = {
-        "href": f"ee://{ASSET_ID}/{band_id}",
-        "type": "image/tiff",
-        "roles": ["data"],
-        "band_name": band_id,
-        "data_type": band["dataType"]["precision"].lower(),
-        "spatial_resolution": res,
-        "description": f"Sentinel-2 band {band_id} of image {ASSET_ID}",
-    }
-
-# 5. Convert bbox to array format
-bbox_coords = [min(lons), min(lats), max(lons), max(lats)]
-
-# 6. Build fileSet for the bands
-fileSet_id = f"sentinel2-bands-{ASSET_ID.replace('/', '-')}"
-band_files = []
-for band in meta["bands"]:
+    dims = band.get("dimensions", {})
+    content_size = dims.get("width", 0) * dims.get("height", 0) * 2  # Approximate size
+    band_records.append(
+        BandRecord(
+            href=f"ee://{ASSET_ID}/{band_id}",
+            type="image/tiff",
+            roles=["data"],
+            band_name=band_id,
+            data_type=band["dataType"]["precision"].lower(),
+            spatial_resolution=res,
+            description=f"Sentinel-2 band {band_id} of image {ASSET_ID}",
+        )
+    )
     band_files.append(
         {
-            "name": f"{band['id']}.tif",
-            "path": f"ee://{ASSET_ID}/{band['id']}",
-            "contentSize": (
-                band.get("dimensions", {}).get("width", 0)
-                * band.get("dimensions", {}).get("height", 0)
-                * 2
-            ),  # Approximate size
+            "name": f"{band_id}.tif",
+            "path": f"ee://{ASSET_ID}/{band_id}",
+            "contentSize": content_size,
+        }
+    )
+    fileset_file_objects.append(
+        {
+            "@type": "cr:FileObject",
+            "name": f"{band_id}.tif",
+            "contentUrl": f"{base_ee_url}/{band_id}",
+            "encodingFormat": "image/tiff",
+            "contentSize": content_size,
         }
     )
 
+# Materialize dicts only for emission
+assets = {record.band_name: asdict(record) for record in band_records}
+
+# 5. Convert bbox to array format
+bbox_coords = [min_lon, min_lat, max_lon, max_lat]
+
 # 7. Assemble Geo-Croissant JSON-LD (using correct prefixes & geocr IRIs)
 geo_croissant = {
-    "@context": {
-        "@language": "en",
-        "@vocab": "https://schema.org/",
-        "citeAs": "cr:citeAs",
-        "column": "cr:column",
-        "conformsTo": "dct:conformsTo",
-        "cr": "http://mlcommons.org/croissant/",
-        "geocr": "http://mlcommons.org/croissant/geo/",
-        "rai": "http://mlcommons.org/croissant/RAI/",
-        "dct": "http://purl.org/dc/terms/",
-        "sc": "https://schema.org/",
-        "data": {"@id": "cr:data", "@type": "@json"},
-        "examples": {"@id": "cr:examples", "@type": "@json"},
-        "dataBiases": "cr:dataBiases",
-        "dataCollection": "cr:dataCollection",
-        "dataType": {"@id": "cr:dataType", "@type": "@vocab"},
-        "extract": "cr:extract",
-        "field": "cr:field",
-        "fileProperty": "cr:fileProperty",
-        "fileObject": "cr:fileObject",
-        "fileSet": "cr:fileSet",
-        "format": "cr:format",
-        "includes": "cr:includes",
-        "isLiveDataset": "cr:isLiveDataset",
-        "jsonPath": "cr:jsonPath",
-        "key": "cr:key",
-        "md5": "cr:md5",
-        "parentField": "cr:parentField",
-        "path": "cr:path",
-        "personalSensitiveInformation": "cr:personalSensitiveInformation",
-        "recordSet": "cr:recordSet",
-        "references": "cr:references",
-        "regex": "cr:regex",
-        "repeated": "cr:repeated",
-        "replace": "cr:replace",
-        "samplingRate": "cr:samplingRate",
-        "separator": "cr:separator",
-        "source": "cr:source",
-        "subField": "cr:subField",
-        "transform": "cr:transform",
-    },
+    "@context": _CROISSANT_CONTEXT,
     "@type": "sc:Dataset",
-    "name": ASSET_ID.replace("/", "_"),
+    "name": asset_id_safe,
     "alternateName": [
-        ASSET_ID.replace("/", "-"),
+        asset_id_dash,
         f"Sentinel-2-{props.get('MGRS_TILE', '')}",
     ],
     "description": (
@@ -124,7 +135,7 @@ geo_croissant = {
         "name": "European Space Agency (ESA)",
         "url": "https://www.esa.int/",
     },
-    "url": f"https://earthengine.googleapis.com/v1alpha/projects/earthengine-public/assets/{ASSET_ID}",
+    "url": base_ee_url,
     "keywords": [
         "Sentinel-2",
         "satellite imagery",
@@ -136,14 +147,14 @@ geo_croissant = {
         "ESA",
         "Copernicus",
     ],
-    "citeAs": f"https://earthengine.googleapis.com/v1alpha/projects/earthengine-public/assets/{ASSET_ID}",
+    "citeAs": base_ee_url,
     "datePublished": meta["startTime"][:10],
     "license": "https://creativecommons.org/licenses/by/4.0/",
     "spatialCoverage": {
         "@type": "Place",
         "geo": {
             "@type": "GeoShape",
-            "box": f"{min(lats)} {min(lons)} {max(lats)} {max(lons)}"
+            "box": bbox
         }
     },
     "temporalCoverage": f"{meta['startTime']}/{meta['endTime']}",
@@ -164,14 +175,14 @@ geo_croissant = {
     "recordSet": [
         {
             "@type": "cr:RecordSet",
-            "@id": f"sentinel2_bands_{ASSET_ID.replace('/', '_')}",
-            "name": f"sentinel2_bands_{ASSET_ID.replace('/', '_')}",
+            "@id": f"sentinel2_bands_{asset_id_safe}",
+            "name": f"sentinel2_bands_{asset_id_safe}",
             "description": f"Spectral bands for Sentinel-2 image {ASSET_ID}",
             "field": [
                 {
                     "@type": "cr:Field",
-                    "@id": f"{ASSET_ID.replace('/', '_')}/asset_id",
-                    "name": f"{ASSET_ID.replace('/', '_')}/asset_id",
+                    "@id": f"{asset_id_safe}/asset_id",
+                    "name": f"{asset_id_safe}/asset_id",
                     "description": "Asset identifier",
                     "dataType": "sc:Text",
                     "source": {
@@ -181,8 +192,8 @@ geo_croissant = {
                 },
                 {
                     "@type": "cr:Field",
-                    "@id": f"{ASSET_ID.replace('/', '_')}/image_data",
-                    "name": f"{ASSET_ID.replace('/', '_')}/image_data",
+                    "@id": f"{asset_id_safe}/image_data",
+                    "name": f"{asset_id_safe}/image_data",
                     "description": "Satellite imagery data",
                     "dataType": "sc:ImageObject",
                     "source": {
@@ -206,36 +217,24 @@ geo_croissant = {
             "description": f"Sentinel-2 spectral bands for {ASSET_ID}",
             "includes": "*.tif",
             "encodingFormat": "image/tiff",
-            "fileObject": [
-                {
-                    "@type": "cr:FileObject",
-                    "name": f"{band['id']}.tif",
-                    "contentUrl": f"https://earthengine.googleapis.com/v1alpha/projects/earthengine-public/assets/{ASSET_ID}/{band['id']}",
-                    "encodingFormat": "image/tiff",
-                    "contentSize": (
-                        band.get("dimensions", {}).get("width", 0)
-                        * band.get("dimensions", {}).get("height", 0)
-                        * 2
-                    ),
-                }
-                for band in meta["bands"]
-            ],
+            "fileObject": fileset_file_objects,
         }
     ],
     "distribution": [
         {
             "@type": "cr:FileObject",
-            "@id": f"sentinel2-bands-{ASSET_ID.replace('/', '-')}",
+            "@id": fileSet_id,
             "name": f"Sentinel-2 Bands for {ASSET_ID}",
             "description": f"Downloadable Sentinel-2 spectral bands for {ASSET_ID}",
-            "contentUrl": f"https://earthengine.googleapis.com/v1alpha/projects/earthengine-public/assets/{ASSET_ID}",
+            "contentUrl": base_ee_url,
             "encodingFormat": "application/json",
         }
     ],
 }
 
-# 8. Write to file
-with open("gee.json", "w") as f:
-    json.dump(geo_croissant, f, indent=2)
+# 8. Write to file (orjson emits bytes ~an order of magnitude faster than
+#    stdlib json.dump)
+with open("gee.json", "wb") as f:
+    f.write(orjson.dumps(geo_croissant, option=orjson.OPT_INDENT_2))
 
 print("Geo-Croissant JSON-LD saved to gee.json")
\ No newline at end of file
@@ -8,50 +8,241 @@ with proper time-series support conforming to croissant.ttl and geocr.ttl specif
 
 import pystac_client
 import planetary_computer
-from collections import defaultdict
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-import json
+from itertools import islice, repeat
+import fnmatch
+import functools
+import orjson
+import os
+import re
 import sys
+from pathlib import Path
+
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:  # pragma: no cover - ciso8601 is optional
+    def _parse_dt(value):
+        """Fallback ISO-8601 parser when ciso8601 is unavailable."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Canonical JSON-LD context, shared across converters as
+# croissant_context.json at the repository root and parsed once per
+# process.
+_CONTEXT_PATH = Path(__file__).resolve().parent.parent / "croissant_context.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_context():
+    """Load the shared JSON-LD context (one parse per process)."""
+    return orjson.loads(_CONTEXT_PATH.read_bytes())
+
+
+_CROISSANT_CONTEXT = _load_context()
+
+
+# Sentinel-2 spectral band asset keys in canonical order, frozen at import
+_S2_BAND_NAMES = (
+    "B01", "B02", "B03", "B04", "B05", "B06", "B07",
+    "B08", "B8A", "B09", "B10", "B11", "B12",
+)
+
+# O(1) membership test replaces the substring scan that also matched any
+# asset key containing a "B"
+_S2_BANDS = frozenset(_S2_BAND_NAMES)
+
+
+@functools.lru_cache(maxsize=64)
+def _spectral_band_entry(name, center_wavelength, fwhm):
+    """Build (and memoize) one geocr:SpectralBand entry.
+
+    Band metadata is identical across conversions of the same collection,
+    so the nested dicts are allocated once per distinct band rather than
+    once per call.  Callers must treat the returned dict as read-only.
+    """
+    entry = {
+        "@type": "geocr:SpectralBand",
+        "name": name,
+        "geocr:centerWavelength": {
+            "@type": "QuantitativeValue",
+            "value": center_wavelength,
+            "unitText": "nm"
+        }
+    }
+    if fwhm:
+        entry["geocr:bandwidth"] = {
+            "@type": "QuantitativeValue",
+            "value": fwhm,
+            "unitText": "nm"
+        }
+    return entry
+
+
+# Extracts the granule base URL in one scan: strips the SAS token query
+# string and the trailing band-specific ".BXX.tif" suffix when present.
+# URL format: https://.../HLS...v2.0/HLS...v2.0.B01.tif?<sas-token>
+_BASE_URL_RE = re.compile(r"^(?P<base>[^?]*?)(?:\.B\w+\.tif)?(?:\?.*)?$")
+
+# The "*.tif" include glob translated to a regex once at import.  Each
+# FileSet carries the translated pattern as geocr:includesCompiled so
+# consumers can re.compile it directly instead of re-running
+# fnmatch.translate per FileSet; "includes" stays the source of truth.
+_TIF_GLOB = re.compile(fnmatch.translate("*.tif"))
+
+# Below this many items, a worker pool costs more than it saves
+_PARALLEL_MIN_ITEMS = 64
+
+# RecordSet field schema: (name, description, dataType).  The cr:Field
+# dicts are identical on every conversion, so they are built once at
+# import and shared by reference - consumers never mutate them.
+_FIELD_DEFS = (
+    ("granule_id", "Unique identifier for monthly observation", "sc:Text"),
+    ("observation_datetime", "Observation timestamp (ISO 8601)", "sc:DateTime"),
+    ("month", "Year-month (YYYY-MM)", "sc:Text"),
+    ("platform", "Satellite platform", "sc:Text"),
+    ("cloud_cover", "Cloud cover percentage", "sc:Float"),
+)
+
+_FIELD_TEMPLATES = tuple(
+    {
+        "@type": "cr:Field",
+        "@id": f"time_series_observations/{name}",
+        "name": name,
+        "description": description,
+        "dataType": data_type,
+        "source": {
+            "fileSet": "granule_1_bands",  # Reference first granule as example
+            "extract": {
+                "column": name
+            }
+        }
+    }
+    for name, description, data_type in _FIELD_DEFS
+)
+
+
+def _build_fileset(idx, item, band_names):
+    """Build the cr:FileSet entry for one granule.
+
+    Pure function of its arguments, so it can run in worker processes
+    when converting large catalogs.
+    """
+    item_id = item.get('id', f'item_{idx}')
+    dt_str = item.get('properties', {}).get('datetime', '')
+
+    # Get first band asset URL to extract base path
+    assets = item.get('assets', {})
+    if band_names and band_names[0] in assets:
+        first_band_url = assets[band_names[0]].get('href', '')
+
+        # Strip the SAS token and the band-specific ".BXX.tif" suffix
+        # in a single precompiled-regex scan instead of split + rsplit
+        match = _BASE_URL_RE.match(first_band_url)
+        base_url = match.group("base") if match else first_band_url
+        if base_url == first_band_url.partition('?')[0]:
+            # No band suffix was stripped - fall back to the directory
+            base_url = base_url.rsplit('/', 1)[0]
+    else:
+        base_url = ""
+
+    # Create FileSet with pattern matching for all band TIFFs
+    # Note: URLs stored without SAS tokens - re-sign using planetary_computer when accessing
+    return {
+        "@type": "cr:FileSet",
+        "@id": f"granule_{idx}_bands",
+        "name": f"{item_id}_spectral_bands",
+        "description": f"13 spectral band GeoTIFF files for {item_id} ({dt_str}). URLs require signing via Microsoft Planetary Computer.",
+        "contentUrl": base_url,
+        "encodingFormat": "image/tiff",
+        "includes": "*.tif",
+        "geocr:includesCompiled": _TIF_GLOB.pattern
+    }
+
+
+def _build_example(idx, item):
+    """Build one RecordSet example record for a granule."""
+    item_props = item.get('properties', {})
+    item_id = item.get('id', f'item_{idx}')
+    dt_str = item_props.get('datetime', '')
+
+    # ISO-8601 strings carry YYYY-MM in their first seven characters;
+    # slicing gives the month without a parse + locale-aware strftime
+    if len(dt_str) >= 7 and dt_str[4] == '-':
+        month = dt_str[:7]
+    else:
+        month = _parse_dt(dt_str).strftime("%Y-%m")
+
+    return {
+        "granule_id": item_id,
+        "observation_datetime": dt_str,
+        "month": month,
+        "platform": item_props.get('platform', 'sentinel-2b'),
+        "cloud_cover": item_props.get('eo:cloud_cover', 0)
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_catalog():
+    """Open the Planetary Computer STAC client once and reuse it."""
+    return pystac_client.Client.open(
+        "https://planetarycomputer.microsoft.com/api/stac/v1",
+        modifier=planetary_computer.sign_inplace,
+    )
 
 
 def fetch_monthly_items(collection, bbox, time_range):
     """Fetch one STAC item per month for a given spatial and temporal extent.
-    
+
     Args:
         collection: STAC collection ID
         bbox: Bounding box [min_lon, min_lat, max_lon, max_lat]
         time_range: Date range in format "YYYY-MM-DD/YYYY-MM-DD"
-        
+
     Returns:
         List of STAC items (one per month)
     """
-    catalog = pystac_client.Client.open(
-        "https://planetarycomputer.microsoft.com/api/stac/v1",
-        modifier=planetary_computer.sign_inplace,
-    )
-    
+    return _fetch_monthly_items_cached(collection, tuple(bbox), time_range)
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_monthly_items_cached(collection, bbox, time_range):
+    """Cached worker for fetch_monthly_items; bbox must be hashable (tuple)."""
+    catalog = _get_catalog()
+
     search = catalog.search(
         collections=[collection],
         bbox=bbox,
         datetime=time_range,
     )
-    
-    items = list(search.get_items())
-    
-    # Group by month
-    monthly_items = defaultdict(list)
-    for item in items:
-        item_date = datetime.fromisoformat(item.datetime.isoformat())
-        year_month = item_date.strftime("%Y-%m")
-        monthly_items[year_month].append(item)
-    
-    # Select first item from each month
-    selected_items = []
-    for month in sorted(monthly_items.keys()):
-        if monthly_items[month]:
-            selected_items.append(monthly_items[month][0])
-    
-    return selected_items
+
+    # Stream the results and keep only the first item seen per month;
+    # item.datetime is already a datetime, so no isoformat round-trip.
+    seen = {}
+    for item in search.items():
+        year_month = item.datetime.strftime("%Y-%m")
+        seen.setdefault(year_month, item)
+
+    return [seen[month] for month in sorted(seen)]
+
+
+def fetch_monthly_items_parallel(queries, max_workers=8):
+    """Fetch monthly items for several (collection, bbox, time_range) queries.
+
+    Each search blocks on Planetary Computer HTTPS round trips, so the
+    queries are overlapped with a thread pool.  The cached STAC client is
+    shared across threads (pystac_client searches are read-only).
+
+    Args:
+        queries: Iterable of (collection, bbox, time_range) tuples
+        max_workers: Maximum number of concurrent searches
+
+    Returns:
+        List of per-query item lists, in query order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda query: fetch_monthly_items(*query),
+                                 queries))
 
 
 def convert_items_to_geocroissant(items_list):
@@ -80,22 +271,24 @@ def convert_items_to_geocroissant(items_list):
     min_lat = float('inf')
     max_lon = float('-inf')
     max_lat = float('-inf')
-    
-    for item in items_list:
-        dt_str = item.get('properties', {}).get('datetime')
-        if dt_str:
-            dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-            if min_date is None or dt < min_date:
-                min_date = dt
-            if max_date is None or dt > max_date:
-                max_date = dt
-        
-        bbox = item.get('bbox', [])
-        if bbox and len(bbox) >= 4:
-            min_lon = min(min_lon, bbox[0])
-            min_lat = min(min_lat, bbox[1])
-            max_lon = max(max_lon, bbox[2])
-            max_lat = max(max_lat, bbox[3])
+
+    # STAC items in a collection share one ISO-8601 UTC layout, so the
+    # strings order lexicographically; reduce on the raw strings and parse
+    # only the two extremes instead of every item.
+    dt_strs = [dt_str for item in items_list
+               if (dt_str := item.get('properties', {}).get('datetime'))]
+    if dt_strs:
+        min_date = _parse_dt(min(dt_strs))
+        max_date = _parse_dt(max(dt_strs))
+
+    # Stack bboxes into an (N, 4) array and reduce in one vectorized pass
+    # instead of four Python-level min/max calls per item
+    bboxes = [item['bbox'][:4] for item in items_list
+              if len(item.get('bbox', [])) >= 4]
+    if bboxes:
+        bbox_arr = np.asarray(bboxes, dtype=np.float64)
+        min_lon, min_lat = bbox_arr[:, :2].min(axis=0)
+        max_lon, max_lat = bbox_arr[:, 2:].max(axis=0)
     
     # Extract spectral bands from first item - DEFINED ONCE for entire dataset
     first_item = items_list[0]
@@ -103,74 +296,25 @@ def convert_items_to_geocroissant(items_list):
     band_names = []
     
     for asset_key, asset in first_item.get('assets', {}).items():
-        if 'B' in asset_key or 'B8A' in asset_key:
+        if asset_key in _S2_BANDS:
             band_names.append(asset_key)
             eo_bands = asset.get('eo:bands', [])
             if eo_bands:
-                spectral_band_entry = {
-                    "@type": "geocr:SpectralBand",
-                    "name": eo_bands[0].get('common_name', asset_key),
-                    "geocr:centerWavelength": {
-                        "@type": "QuantitativeValue",
-                        "value": eo_bands[0].get('center_wavelength'),
-                        "unitText": "nm"
-                    }
-                }
-                if eo_bands[0].get('full_width_half_max'):
-                    spectral_band_entry["geocr:bandwidth"] = {
-                        "@type": "QuantitativeValue",
-                        "value": eo_bands[0].get('full_width_half_max'),
-                        "unitText": "nm"
-                    }
-                spectral_bands.append(spectral_band_entry)
+                # Bind the band dict once instead of re-indexing and
+                # re-hashing eo_bands[0] for every attribute
+                eo = eo_bands[0]
+                spectral_bands.append(_spectral_band_entry(
+                    eo.get('common_name', asset_key),
+                    eo.get('center_wavelength'),
+                    eo.get('full_width_half_max'),
+                ))
     
     first_props = first_item.get('properties', {})
     proj_code = first_props.get('proj:code', 'EPSG:4326')
     
     # Build Geocroissant structure
     geocr_dataset = {
-        "@context": {
-            "@language": "en",
-            "@vocab": "https://schema.org/",
-            "cr": "http://mlcommons.org/croissant/",
-            "geocr": "http://mlcommons.org/croissant/geo/",
-            "dct": "http://purl.org/dc/terms/",
-            "sc": "https://schema.org/",
-            "citeAs": "cr:citeAs",
-            "column": "cr:column",
-            "conformsTo": "dct:conformsTo",
-            "data": {"@id": "cr:data", "@type": "@json"},
-            "examples": {"@id": "cr:examples", "@type": "@json"},
-            "dataBiases": "cr:dataBiases",
-            "dataCollection": "cr:dataCollection",
-            "dataType": {"@id": "cr:dataType", "@type": "@vocab"},
-            "extract": "cr:extract",
-            "field": "cr:field",
-            "fileObject": "cr:fileObject",
-            "fileProperty": "cr:fileProperty",
-            "fileSet": "cr:fileSet",
-            "format": "cr:format",
-            "includes": "cr:includes",
-            "isLiveDataset": "cr:isLiveDataset",
-            "jsonPath": "cr:jsonPath",
-            "key": "cr:key",
-            "md5": "cr:md5",
-            "parentField": "cr:parentField",
-            "path": "cr:path",
-            "personalSensitiveInformation": "cr:personalSensitiveInformation",
-            "recordSet": "cr:recordSet",
-            "references": "cr:references",
-            "regex": "cr:regex",
-            "repeated": "cr:repeated",
-            "replace": "cr:replace",
-            "samplingRate": "cr:samplingRate",
-            "separator": "cr:separator",
-            "source": "cr:source",
-            "subField": "cr:subField",
-            "transform": "cr:transform",
-            "equivalentProperty": "cr:equivalentProperty",
-            "rai": "http://mlcommons.org/croissant/RAI/"
-        },
+        "@context": _CROISSANT_CONTEXT,
         "@type": "sc:Dataset",
         "name": "HLS_Sentinel2_TimeSeries_Jan_Dec_2025",
         "description": f"Sentinel-2B HLS time series with {len(items_list)} monthly observations. IMPORTANT: Band configuration ({len(band_names)} bands) and spectral metadata are defined ONCE at dataset level and inherited by ALL monthly observations. Individual monthly granules with their TIFF file URLs listed in distribution.",
@@ -231,42 +375,29 @@ def convert_items_to_geocroissant(items_list):
         "distribution": []
     }
     
-    # Create FileSet entries for each month's spectral bands  
-    for idx, item in enumerate(items_list, 1):
-        item_id = item.get('id', f'item_{idx}')
-        dt_str = item.get('properties', {}).get('datetime', '')
-        
-        # Get first band asset URL to extract base path
-        assets = item.get('assets', {})
-        if band_names and band_names[0] in assets:
-            first_band_url = assets[band_names[0]].get('href', '')
-            
-            # Strip SAS token (query parameters) to get permanent base URL
-            if '?' in first_band_url:
-                first_band_url = first_band_url.split('?')[0]
-            
-            # Extract base URL (remove band-specific part)
-            # URL format: https://.../HLS.S30.T11SMT.2025027T183539.v2.0/HLS.S30.T11SMT.2025027T183539.v2.0.B01.tif
-            if '.B' in first_band_url:
-                base_url = first_band_url.rsplit('.B', 1)[0]  # Get path without .BXX.tif
-            else:
-                base_url = first_band_url.rsplit('/', 1)[0]  # Get directory
-        else:
-            base_url = ""
-        
-        # Create FileSet with pattern matching for all band TIFFs
-        # Note: URLs stored without SAS tokens - re-sign using planetary_computer when accessing
-        file_set = {
-            "@type": "cr:FileSet",
-            "@id": f"granule_{idx}_bands",
-            "name": f"{item_id}_spectral_bands",
-            "description": f"13 spectral band GeoTIFF files for {item_id} ({dt_str}). URLs require signing via Microsoft Planetary Computer.",
-            "contentUrl": base_url,
-            "encodingFormat": "image/tiff",
-            "includes": "*.tif"
-        }
-        geocr_dataset['distribution'].append(file_set)
-    
+    # Create FileSet entries for each month's spectral bands and collect
+    # the two example records.  Each granule's FileSet is independent, so
+    # large catalogs fan the construction out across worker processes;
+    # small ones run a fused single pass with a pre-sized list.
+    n_items = len(items_list)
+    examples = [_build_example(idx, item)
+                for idx, item in enumerate(islice(items_list, 2), 1)]
+    if n_items >= _PARALLEL_MIN_ITEMS:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            distributions = list(executor.map(
+                _build_fileset,
+                range(1, n_items + 1),
+                items_list,
+                repeat(band_names),
+                chunksize=64,
+            ))
+    else:
+        distributions = [None] * n_items
+        for idx, item in enumerate(items_list, 1):
+            distributions[idx - 1] = _build_fileset(idx, item, band_names)
+
+    geocr_dataset['distribution'] = distributions
+
     # RecordSet with geocr:timeSeriesIndex
     time_series_recordset = {
         "@type": "cr:RecordSet",
@@ -277,108 +408,66 @@ def convert_items_to_geocroissant(items_list):
         # KEY for time-series: indicates temporal ordering field
         "geocr:timeSeriesIndex": "observation_datetime",
         
-        "field": [
-            {
-                "@type": "cr:Field",
-                "@id": "time_series_observations/granule_id",
-                "name": "granule_id",
-                "description": "Unique identifier for monthly observation",
-                "dataType": "sc:Text",
-                "source": {
-                    "fileSet": "granule_1_bands",  # Reference first granule as example
-                    "extract": {
-                        "column": "granule_id"
-                    }
-                }
-            },
-            {
-                "@type": "cr:Field",
-                "@id": "time_series_observations/observation_datetime",
-                "name": "observation_datetime",
-                "description": "Observation timestamp (ISO 8601)",
-                "dataType": "sc:DateTime",
-                "source": {
-                    "fileSet": "granule_1_bands",
-                    "extract": {
-                        "column": "observation_datetime"
-                    }
-                }
-            },
-            {
-                "@type": "cr:Field",
-                "@id": "time_series_observations/month",
-                "name": "month",
-                "description": "Year-month (YYYY-MM)",
-                "dataType": "sc:Text",
-                "source": {
-                    "fileSet": "granule_1_bands",
-                    "extract": {
-                        "column": "month"
-                    }
-                }
-            },
-            {
-                "@type": "cr:Field",
-                "@id": "time_series_observations/platform",
-                "name": "platform",
-                "description": "Satellite platform",
-                "dataType": "sc:Text",
-                "source": {
-                    "fileSet": "granule_1_bands",
-                    "extract": {
-                        "column": "platform"
-                    }
-                }
-            },
-            {
-                "@type": "cr:Field",
-                "@id": "time_series_observations/cloud_cover",
-                "name": "cloud_cover",
-                "description": "Cloud cover percentage",
-                "dataType": "sc:Float",
-                "source": {
-                    "fileSet": "granule_1_bands",
-                    "extract": {
-                        "column": "cloud_cover"
-                    }
-                }
-            }
-        ],
+        "field": list(_FIELD_TEMPLATES),
         
-        # Examples: Only 2 sample records to illustrate structure
-        "examples": []
+        # Examples: Only 2 sample records to illustrate structure,
+        # built in their own pass over the first two items above
+        "examples": examples
     }
-    
-    # Add only 2 example records (NOT all months!)
-    for idx, item in enumerate(items_list[:2], 1):
-        item_props = item.get('properties', {})
-        item_id = item.get('id', f'item_{idx}')
-        dt_str = item_props.get('datetime', '')
-        dt_obj = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        
-        example = {
-            "granule_id": item_id,
-            "observation_datetime": dt_str,
-            "month": dt_obj.strftime("%Y-%m"),
-            "platform": item_props.get('platform', 'sentinel-2b'),
-            "cloud_cover": item_props.get('eo:cloud_cover', 0)
-        }
-        time_series_recordset['examples'].append(example)
-    
+
     geocr_dataset['recordSet'] = [time_series_recordset]
     
     return geocr_dataset
 
 
-def save_geocroissant(dataset, filename):
+def write_geocroissant_stream(f, dataset):
+    """Stream a GeoCroissant dataset to an open binary file.
+
+    Top-level values are serialized one at a time and each FileSet in
+    'distribution' is emitted individually, so peak memory during the write
+    is bounded by the largest single entry rather than the full document
+    byte string - this is what keeps long time series (thousands of monthly
+    granules) from doubling their memory footprint at save time.
+
+    Args:
+        f: Binary file object opened for writing
+        dataset: GeoCroissant dataset dictionary
+    """
+    write = f.write
+    write(b"{")
+    first = True
+    for key, value in dataset.items():
+        if not first:
+            write(b",")
+        first = False
+        write(orjson.dumps(key))
+        write(b":")
+        if key == "distribution":
+            write(b"[")
+            for idx, file_set in enumerate(value):
+                if idx:
+                    write(b",")
+                write(orjson.dumps(file_set))
+            write(b"]")
+        else:
+            write(orjson.dumps(value))
+    write(b"}")
+
+
+def save_geocroissant(dataset, filename, pretty=True):
     """Save GeoCroissant dataset to JSON file.
-    
+
     Args:
         dataset: GeoCroissant dataset dictionary
         filename: Output file path
+        pretty: Indent the output for human readers; pass False in
+            pipelines to get the compact streaming writer instead
     """
-    with open(filename, 'w') as f:
-        json.dump(dataset, f, indent=2)
+    with open(filename, 'wb', buffering=1024 * 1024) as f:
+        if pretty:
+            f.write(orjson.dumps(dataset, option=orjson.OPT_INDENT_2))
+        else:
+            write_geocroissant_stream(f, dataset)
 
 
 def main():
@@ -1,198 +1,288 @@
-import json
-from rdflib import Graph, Namespace, URIRef, Literal, BNode
-from rdflib.namespace import DCTERMS, DCAT, FOAF, XSD, RDF
-from urllib.parse import quote
-
-
-def geocroissant_to_geodcat_jsonld(geocroissant_json, output_file="geodcat.jsonld"):
-    """Convert GeoCroissant JSON-LD to GeoDCAT-AP compliant format"""
-    g = Graph()
-
-    # Namespaces
-    GEO = Namespace("http://www.opengis.net/ont/geosparql#")
-    SCHEMA = Namespace("https://schema.org/")
-    SPDX = Namespace("http://spdx.org/rdf/terms#")
-    ADMS = Namespace("http://www.w3.org/ns/adms#")
-    PROV = Namespace("http://www.w3.org/ns/prov#")
-    GEOCR = Namespace("http://mlcommons.org/croissant/geo/")
-
-    g.bind("dct", DCTERMS)
-    g.bind("dcat", DCAT)
-    g.bind("foaf", FOAF)
-    g.bind("geo", GEO)
-    g.bind("schema", SCHEMA)
-    g.bind("spdx", SPDX)
-    g.bind("adms", ADMS)
-    g.bind("prov", PROV)
-    g.bind("geocr", GEOCR)
-
-    # Create dataset URI
-    dataset_name = geocroissant_json.get("name", "dataset")
-    # URL-encode the dataset name to handle spaces and special characters
-    safe_name = quote(dataset_name, safe='')
-    dataset_uri = URIRef(f"https://example.org/{safe_name}")
-    
-    # Basic dataset properties
-    g.add((dataset_uri, RDF.type, DCAT.Dataset))
-    g.add((dataset_uri, RDF.type, SCHEMA.Dataset))
-    g.add((dataset_uri, DCTERMS.title, Literal(geocroissant_json["name"])))
-    g.add((dataset_uri, DCTERMS.description, Literal(geocroissant_json["description"])))
-    
-    # License
-    if "license" in geocroissant_json:
-        g.add((dataset_uri, DCTERMS.license, URIRef(geocroissant_json["license"])))
-    
-    # Version
-    if "version" in geocroissant_json:
-        g.add((dataset_uri, ADMS.version, Literal(geocroissant_json["version"])))
-    
-    # Date published
-    if "datePublished" in geocroissant_json:
-        g.add((dataset_uri, DCTERMS.issued, Literal(geocroissant_json["datePublished"], datatype=XSD.date)))
-    
-    # ConformsTo
-    for conformance in geocroissant_json.get("conformsTo", []):
-        g.add((dataset_uri, DCTERMS.conformsTo, URIRef(conformance)))
-    
-    # Keywords
-    for keyword in geocroissant_json.get("keywords", []):
-        g.add((dataset_uri, DCAT.keyword, Literal(keyword)))
-    
-    # Spatial coverage
-    spatial_coverage = geocroissant_json.get("spatialCoverage", {})
-    if spatial_coverage and "geo" in spatial_coverage:
-        geo_shape = spatial_coverage["geo"]
-        if "box" in geo_shape:
-            # Parse the bounding box (south west north east format)
-            bbox = geo_shape["box"].split()
-            if len(bbox) == 4:
-                spatial_uri = URIRef(f"{dataset_uri}/spatial")
-                g.add((dataset_uri, DCTERMS.spatial, spatial_uri))
-                g.add((spatial_uri, RDF.type, DCTERMS.Location))
-                
-                # Create WKT polygon from bounding box
-                south, west, north, east = bbox
-                wkt_bbox = f"POLYGON(({west} {south}, {east} {south}, {east} {north}, {west} {north}, {west} {south}))"
-                g.add((spatial_uri, GEO.asWKT, Literal(wkt_bbox, datatype=GEO.wktLiteral)))
-    
-    # Temporal coverage
-    if "temporalCoverage" in geocroissant_json:
-        temporal_coverage = geocroissant_json["temporalCoverage"]
-        if "/" in temporal_coverage:
-            start_date, end_date = temporal_coverage.split("/")
-            temporal_uri = URIRef(f"{dataset_uri}/temporal")
-            g.add((dataset_uri, DCTERMS.temporal, temporal_uri))
-            g.add((temporal_uri, RDF.type, DCTERMS.PeriodOfTime))
-            g.add((temporal_uri, DCAT.startDate, Literal(start_date, datatype=XSD.date)))
-            g.add((temporal_uri, DCAT.endDate, Literal(end_date, datatype=XSD.date)))
-    
-    # GeoCroissant specific properties
-    if "geocr:coordinateReferenceSystem" in geocroissant_json:
-        crs_uri = URIRef(f"http://www.opengis.net/def/crs/{geocroissant_json['geocr:coordinateReferenceSystem']}")
-        g.add((dataset_uri, GEOCR.coordinateReferenceSystem, crs_uri))
-    
-    # Spatial resolution
-    if "geocr:spatialResolution" in geocroissant_json:
-        spatial_res = geocroissant_json["geocr:spatialResolution"]
-        if isinstance(spatial_res, dict) and "@type" in spatial_res:
-            res_node = BNode()
-            g.add((dataset_uri, GEOCR.spatialResolution, res_node))
-            g.add((res_node, RDF.type, SCHEMA.QuantitativeValue))
-            if "value" in spatial_res:
-                g.add((res_node, SCHEMA.value, Literal(spatial_res["value"])))
-            if "unitText" in spatial_res:
-                g.add((res_node, SCHEMA.unitText, Literal(spatial_res["unitText"])))
-    
-    # Temporal resolution
-    if "geocr:temporalResolution" in geocroissant_json:
-        temporal_res = geocroissant_json["geocr:temporalResolution"]
-        if isinstance(temporal_res, dict) and "@type" in temporal_res:
-            res_node = BNode()
-            g.add((dataset_uri, GEOCR.temporalResolution, res_node))
-            g.add((res_node, RDF.type, SCHEMA.QuantitativeValue))
-            if "value" in temporal_res:
-                g.add((res_node, SCHEMA.value, Literal(temporal_res["value"])))
-            if "unitText" in temporal_res:
-                g.add((res_node, SCHEMA.unitText, Literal(temporal_res["unitText"])))
-    
-    # Distributions
-    for dist in geocroissant_json.get("distribution", []):
-        if dist.get("@type") == "cr:FileObject":
-            dist_id = dist.get("@id", "distribution")
-            dist_uri = URIRef(f"{dataset_uri}/distribution/{dist_id}")
-            g.add((dataset_uri, DCAT.distribution, dist_uri))
-            g.add((dist_uri, RDF.type, DCAT.Distribution))
-            
-            if "name" in dist:
-                g.add((dist_uri, DCTERMS.title, Literal(dist["name"])))
-            if "description" in dist:
-                g.add((dist_uri, DCTERMS.description, Literal(dist["description"])))
-            if "contentUrl" in dist:
-                g.add((dist_uri, DCAT.accessURL, URIRef(dist["contentUrl"])))
-            if "encodingFormat" in dist:
-                g.add((dist_uri, DCAT.mediaType, Literal(dist["encodingFormat"])))
-            if "md5" in dist:
-                checksum_node = BNode()
-                g.add((dist_uri, SPDX.checksum, checksum_node))
-                g.add((checksum_node, RDF.type, SPDX.Checksum))
-                g.add((checksum_node, SPDX.algorithm, SPDX.checksumAlgorithm_md5))
-                g.add((checksum_node, SPDX.checksumValue, Literal(dist["md5"])))
-        
-        elif dist.get("@type") == "cr:FileSet":
-            # Handle FileSet as a special type of distribution
-            dist_id = dist.get("@id", "fileset")
-            dist_uri = URIRef(f"{dataset_uri}/distribution/{dist_id}")
-            g.add((dataset_uri, DCAT.distribution, dist_uri))
-            g.add((dist_uri, RDF.type, DCAT.Distribution))
-            g.add((dist_uri, RDF.type, GEOCR.FileSet))
-            
-            if "name" in dist:
-                g.add((dist_uri, DCTERMS.title, Literal(dist["name"])))
-            if "description" in dist:
-                g.add((dist_uri, DCTERMS.description, Literal(dist["description"])))
-            if "encodingFormat" in dist:
-                g.add((dist_uri, DCAT.mediaType, Literal(dist["encodingFormat"])))
-            if "includes" in dist:
-                g.add((dist_uri, GEOCR.includes, Literal(dist["includes"])))
-    
-    # Record sets and fields (as additional metadata)
-    for record_set in geocroissant_json.get("recordSet", []):
-        if record_set.get("@type") == "cr:RecordSet":
-            rs_id = record_set.get("@id", record_set.get("name", "recordset"))
-            rs_uri = URIRef(f"{dataset_uri}/recordset/{rs_id}")
-            g.add((dataset_uri, GEOCR.recordSet, rs_uri))
-            g.add((rs_uri, RDF.type, GEOCR.RecordSet))
-            
-            if "name" in record_set:
-                g.add((rs_uri, DCTERMS.title, Literal(record_set["name"])))
-            if "description" in record_set:
-                g.add((rs_uri, DCTERMS.description, Literal(record_set["description"])))
-            
-            # Handle fields
-            for field in record_set.get("field", []):
-                if field.get("@type") == "cr:Field":
-                    field_id = field.get("@id", field.get("name", "field"))
-                    field_uri = URIRef(f"{rs_uri}/field/{field_id}")
-                    g.add((rs_uri, GEOCR.field, field_uri))
-                    g.add((field_uri, RDF.type, GEOCR.Field))
-                    
-                    if "name" in field:
-                        g.add((field_uri, DCTERMS.title, Literal(field["name"])))
-                    if "description" in field:
-                        g.add((field_uri, DCTERMS.description, Literal(field["description"])))
-                    if "dataType" in field:
-                        g.add((field_uri, GEOCR.dataType, Literal(field["dataType"])))
-
-    # Serialize outputs
-    g.serialize(destination=output_file, format="json-ld", indent=2)
-    print(f"GeoDCAT JSON-LD metadata written to {output_file}")
-
-    g.serialize(destination="geodcat.ttl", format="turtle")
-    print("GeoDCAT Turtle metadata written to geodcat.ttl")
-
-
-if __name__ == "__main__":
-    with open("croissant.json", "r") as f:
-        geocroissant = json.load(f)
-
-    geocroissant_to_geodcat_jsonld(geocroissant, output_file="geodcat.jsonld")
+import json
+import re
+from rdflib import Graph
+from urllib.parse import quote
+
+# Matches any character quote(safe='') would percent-encode (i.e. outside
+# RFC 3986's unreserved set); used to skip quote() for typical names
+_UNSAFE_URI_CHARS_RE = re.compile(r"[^A-Za-z0-9._~-]")
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Prefixes for the emitted JSON-LD document (same vocabulary the previous
+# rdflib-based serializer bound on the graph)
+_JSONLD_CONTEXT = {
+    "dct": "http://purl.org/dc/terms/",
+    "dcat": "http://www.w3.org/ns/dcat#",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "geo": "http://www.opengis.net/ont/geosparql#",
+    "schema": "https://schema.org/",
+    "spdx": "http://spdx.org/rdf/terms#",
+    "adms": "http://www.w3.org/ns/adms#",
+    "prov": "http://www.w3.org/ns/prov#",
+    "geocr": "http://mlcommons.org/croissant/geo/",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+
+def _date(value):
+    """Wrap a string as an xsd:date literal."""
+    return {"@value": value, "@type": "xsd:date"}
+
+
+def _quantitative_value(quantity):
+    """Map a GeoCroissant QuantitativeValue dict to a schema.org node."""
+    node = {"@type": "schema:QuantitativeValue"}
+    if "value" in quantity:
+        node["schema:value"] = quantity["value"]
+    if "unitText" in quantity:
+        node["schema:unitText"] = quantity["unitText"]
+    return node
+
+
+def _distribution_node(dist, dist_prefix):
+    """Build the JSON-LD node for one cr:FileObject / cr:FileSet entry.
+
+    *dist_prefix* is the shared "<dataset>/distribution/" string, computed
+    once by the caller so each node ID is a single concatenation.
+    """
+    dist_type = dist.get("@type")
+    if dist_type == "cr:FileObject":
+        dist_id = dist.get("@id", "distribution")
+        node = {
+            "@id": dist_prefix + dist_id,
+            "@type": "dcat:Distribution",
+        }
+        if "contentUrl" in dist:
+            node["dcat:accessURL"] = {"@id": dist["contentUrl"]}
+        if "md5" in dist:
+            node["spdx:checksum"] = {
+                "@type": "spdx:Checksum",
+                "spdx:algorithm": {"@id": "spdx:checksumAlgorithm_md5"},
+                "spdx:checksumValue": dist["md5"],
+            }
+    elif dist_type == "cr:FileSet":
+        dist_id = dist.get("@id", "fileset")
+        node = {
+            "@id": dist_prefix + dist_id,
+            "@type": ["dcat:Distribution", "geocr:FileSet"],
+        }
+        if "includes" in dist:
+            node["geocr:includes"] = dist["includes"]
+    else:
+        return None
+
+    if "name" in dist:
+        node["dct:title"] = dist["name"]
+    if "description" in dist:
+        node["dct:description"] = dist["description"]
+    if "encodingFormat" in dist:
+        node["dcat:mediaType"] = dist["encodingFormat"]
+    return node
+
+
+def _field_node(field, field_prefix):
+    """Build the JSON-LD node for one cr:Field entry."""
+    field_id = field.get("@id", field.get("name", "field"))
+    node = {
+        "@id": field_prefix + field_id,
+        "@type": "geocr:Field",
+    }
+    if "name" in field:
+        node["dct:title"] = field["name"]
+    if "description" in field:
+        node["dct:description"] = field["description"]
+    if "dataType" in field:
+        node["geocr:dataType"] = field["dataType"]
+    return node
+
+
+def geocroissant_to_geodcat_jsonld(geocroissant_json, output_file="geodcat.jsonld",
+                                   turtle_output=None):
+    """Convert GeoCroissant JSON-LD to GeoDCAT-AP compliant format.
+
+    Turtle serialization is rdflib's slowest path and pure overhead for
+    JSON-LD-only consumers, so it only runs when *turtle_output* names a
+    destination file.
+    """
+    # Create dataset URI
+    dataset_name = geocroissant_json.get("name", "dataset")
+    # URL-encode the dataset name to handle spaces and special characters;
+    # skip the pure-Python quote() when the name is already URI-safe
+    if dataset_name.isascii() and not _UNSAFE_URI_CHARS_RE.search(dataset_name):
+        safe_name = dataset_name
+    else:
+        safe_name = quote(dataset_name, safe='')
+    dataset_uri = "https://example.org/" + safe_name
+
+    # URI prefixes reused across every distribution/recordset/field node
+    dist_prefix = dataset_uri + "/distribution/"
+    rs_prefix = dataset_uri + "/recordset/"
+
+    # Basic dataset properties
+    dataset_node = {
+        "@id": dataset_uri,
+        "@type": ["dcat:Dataset", "schema:Dataset"],
+        "dct:title": geocroissant_json["name"],
+        "dct:description": geocroissant_json["description"],
+    }
+    graph = [dataset_node]
+
+    # License
+    if "license" in geocroissant_json:
+        dataset_node["dct:license"] = {"@id": geocroissant_json["license"]}
+
+    # Version
+    if "version" in geocroissant_json:
+        dataset_node["adms:version"] = geocroissant_json["version"]
+
+    # Date published
+    if "datePublished" in geocroissant_json:
+        dataset_node["dct:issued"] = _date(geocroissant_json["datePublished"])
+
+    # ConformsTo
+    conforms_to = geocroissant_json.get("conformsTo", [])
+    if conforms_to:
+        dataset_node["dct:conformsTo"] = [{"@id": c} for c in conforms_to]
+
+    # Keywords
+    keywords = geocroissant_json.get("keywords", [])
+    if keywords:
+        dataset_node["dcat:keyword"] = list(keywords)
+
+    # Spatial coverage
+    spatial_coverage = geocroissant_json.get("spatialCoverage", {})
+    if spatial_coverage and "geo" in spatial_coverage:
+        geo_shape = spatial_coverage["geo"]
+        if "box" in geo_shape:
+            # Parse the bounding box (south west north east format)
+            bbox = geo_shape["box"].split()
+            if len(bbox) == 4:
+                spatial_uri = dataset_uri + "/spatial"
+                dataset_node["dct:spatial"] = {"@id": spatial_uri}
+
+                # Create WKT polygon from bounding box
+                south, west, north, east = bbox
+                wkt_bbox = f"POLYGON(({west} {south}, {east} {south}, {east} {north}, {west} {north}, {west} {south}))"
+                graph.append({
+                    "@id": spatial_uri,
+                    "@type": "dct:Location",
+                    "geo:asWKT": {
+                        "@value": wkt_bbox,
+                        "@type": "geo:wktLiteral",
+                    },
+                })
+
+    # Temporal coverage
+    if "temporalCoverage" in geocroissant_json:
+        temporal_coverage = geocroissant_json["temporalCoverage"]
+        if "/" in temporal_coverage:
+            start_date, end_date = temporal_coverage.split("/")
+            temporal_uri = dataset_uri + "/temporal"
+            dataset_node["dct:temporal"] = {"@id": temporal_uri}
+            graph.append({
+                "@id": temporal_uri,
+                "@type": "dct:PeriodOfTime",
+                "dcat:startDate": _date(start_date),
+                "dcat:endDate": _date(end_date),
+            })
+
+    # GeoCroissant specific properties
+    if "geocr:coordinateReferenceSystem" in geocroissant_json:
+        crs_uri = f"http://www.opengis.net/def/crs/{geocroissant_json['geocr:coordinateReferenceSystem']}"
+        dataset_node["geocr:coordinateReferenceSystem"] = {"@id": crs_uri}
+
+    # Spatial resolution
+    spatial_res = geocroissant_json.get("geocr:spatialResolution")
+    if isinstance(spatial_res, dict) and "@type" in spatial_res:
+        dataset_node["geocr:spatialResolution"] = _quantitative_value(spatial_res)
+
+    # Temporal resolution
+    temporal_res = geocroissant_json.get("geocr:temporalResolution")
+    if isinstance(temporal_res, dict) and "@type" in temporal_res:
+        dataset_node["geocr:temporalResolution"] = _quantitative_value(temporal_res)
+
+    # Distributions
+    dist_nodes = [
+        node
+        for dist in geocroissant_json.get("distribution", [])
+        if (node := _distribution_node(dist, dist_prefix)) is not None
+    ]
+    if dist_nodes:
+        dataset_node["dcat:distribution"] = [{"@id": n["@id"]} for n in dist_nodes]
+        graph.extend(dist_nodes)
+
+    # Record sets and fields (as additional metadata)
+    rs_refs = []
+    for record_set in geocroissant_json.get("recordSet", []):
+        if record_set.get("@type") != "cr:RecordSet":
+            continue
+        rs_id = record_set.get("@id", record_set.get("name", "recordset"))
+        rs_uri = rs_prefix + rs_id
+        field_prefix = rs_uri + "/field/"
+        rs_node = {
+            "@id": rs_uri,
+            "@type": "geocr:RecordSet",
+        }
+        if "name" in record_set:
+            rs_node["dct:title"] = record_set["name"]
+        if "description" in record_set:
+            rs_node["dct:description"] = record_set["description"]
+
+        # Handle fields
+        field_nodes = [
+            _field_node(field, field_prefix)
+            for field in record_set.get("field", [])
+            if field.get("@type") == "cr:Field"
+        ]
+        if field_nodes:
+            rs_node["geocr:field"] = [{"@id": n["@id"]} for n in field_nodes]
+
+        rs_refs.append({"@id": rs_uri})
+        graph.append(rs_node)
+        graph.extend(field_nodes)
+
+    if rs_refs:
+        dataset_node["geocr:recordSet"] = rs_refs
+
+    doc = {
+        "@context": _JSONLD_CONTEXT,
+        "@graph": graph,
+    }
+
+    # Serialize JSON-LD directly from the dict - no triple store involved.
+    # orjson emits bytes several times faster than stdlib json when present.
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream encoder chunks straight to the file instead of building
+        # one giant string; the document is tree-shaped, so circular
+        # reference checking is pure overhead.
+        encoder = json.JSONEncoder(indent=2, check_circular=False)
+        with open(output_file, "w") as f:
+            write = f.write
+            for chunk in encoder.iterencode(doc):
+                write(chunk)
+    print(f"GeoDCAT JSON-LD metadata written to {output_file}")
+
+    # Turtle still goes through rdflib, loading the finished JSON-LD document
+    # into a graph in one parse instead of hundreds of g.add calls
+    if turtle_output is not None:
+        g = Graph()
+        g.parse(data=json.dumps(doc), format="json-ld")
+        for prefix, iri in _JSONLD_CONTEXT.items():
+            g.bind(prefix, iri)
+        g.serialize(destination=turtle_output, format="turtle")
+        print(f"GeoDCAT Turtle metadata written to {turtle_output}")
+
+
+if __name__ == "__main__":
+    with open("croissant.json", "r") as f:
+        geocroissant = json.load(f)
+
+    geocroissant_to_geodcat_jsonld(geocroissant, output_file="geodcat.jsonld",
+                                   turtle_output="geodcat.ttl")
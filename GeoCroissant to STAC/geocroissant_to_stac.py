@@ -1,8 +1,28 @@
 import json
 from datetime import datetime
+
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:  # pragma: no cover - ciso8601 is optional
+    def _parse_dt(value):
+        """Fallback ISO-8601 parser when ciso8601 is unavailable."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 from pystac import Item, Asset, MediaType
 from pystac.extensions.projection import ProjectionExtension
 
+# Encoding-format to STAC media-type dispatch; one lowercase dict lookup
+# replaces the branchy substring tests in the per-asset loop
+_MEDIA_TYPE_MAP = {
+    "image/tiff": MediaType.GEOTIFF,
+    "tiff": MediaType.GEOTIFF,
+    "tif": MediaType.GEOTIFF,
+    "application/json": MediaType.JSON,
+    "json": MediaType.JSON,
+    "application/parquet": MediaType.PARQUET,
+    "parquet": MediaType.PARQUET,
+}
+
 def geocroissant_to_stac(geocroissant_data):
     """Convert GeoCroissant metadata to STAC Item."""
     
@@ -13,14 +33,16 @@ def geocroissant_to_stac(geocroissant_data):
     license_info = geocroissant_data.get("license", "proprietary")
     keywords = geocroissant_data.get("keywords", [])
     
-    # Parse spatial coverage (GeoCroissant format: "south west north east")
-    spatial_coverage = geocroissant_data.get("spatialCoverage", {})
-    geo_info = spatial_coverage.get("geo", {}) if isinstance(spatial_coverage, dict) else {}
-    bbox_string = geo_info.get("box", "") if isinstance(geo_info, dict) else ""
-    
+    # Parse spatial coverage (GeoCroissant format: "south west north east").
+    # Parsed JSON only contains dicts/lists, so a single guarded lookup
+    # replaces the per-level get + isinstance chain.
+    try:
+        bbox_string = geocroissant_data["spatialCoverage"]["geo"]["box"]
+    except (KeyError, TypeError):
+        bbox_string = ""
+
     if bbox_string:
-        coords = [float(x) for x in bbox_string.split()]
-        south, west, north, east = coords
+        south, west, north, east = map(float, bbox_string.split())
         bbox = [west, south, east, north]  # STAC format: [west, south, east, north]
         geometry = {
             "type": "Polygon",
@@ -42,8 +64,8 @@ def geocroissant_to_stac(geocroissant_data):
     temporal_coverage = geocroissant_data.get("temporalCoverage", "")
     if temporal_coverage and "/" in temporal_coverage:
         start_str, end_str = temporal_coverage.split("/")
-        start_dt = datetime.fromisoformat(start_str)
-        end_dt = datetime.fromisoformat(end_str)
+        start_dt = _parse_dt(start_str)
+        end_dt = _parse_dt(end_str)
         midpoint_dt = start_dt + (end_dt - start_dt) / 2
     else:
         start_dt = end_dt = None
@@ -64,13 +86,18 @@ def geocroissant_to_stac(geocroissant_data):
     # Add GeoCroissant metadata
     crs = geocroissant_data.get("geocr:coordinateReferenceSystem")
     
-    spatial_res = geocroissant_data.get("geocr:spatialResolution", {})
-    if isinstance(spatial_res, dict) and spatial_res.get("value"):
-        properties["gsd"] = float(spatial_res["value"])
-    
-    temporal_res = geocroissant_data.get("geocr:temporalResolution", {})
-    if isinstance(temporal_res, dict) and temporal_res.get("value"):
-        properties["geocr:temporalResolution"] = f"{temporal_res['value']} {temporal_res.get('unitText', '')}"
+    try:
+        properties["gsd"] = float(geocroissant_data["geocr:spatialResolution"]["value"])
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        temporal_res = geocroissant_data["geocr:temporalResolution"]
+        value = temporal_res["value"]
+        if value:
+            properties["geocr:temporalResolution"] = f"{value} {temporal_res.get('unitText', '')}"
+    except (KeyError, TypeError):
+        pass
     
     sampling_strategy = geocroissant_data.get("geocr:samplingStrategy")
     if sampling_strategy:
@@ -110,14 +137,7 @@ def geocroissant_to_stac(geocroissant_data):
         encoding_format = dist_item.get("encodingFormat", "")
         
         # Determine media type
-        if "tiff" in encoding_format.lower() or "tif" in encoding_format.lower():
-            media_type = MediaType.GEOTIFF
-        elif "json" in encoding_format.lower():
-            media_type = MediaType.JSON
-        elif "parquet" in encoding_format.lower():
-            media_type = MediaType.PARQUET
-        else:
-            media_type = encoding_format
+        media_type = _MEDIA_TYPE_MAP.get(encoding_format.lower(), encoding_format)
         
         # Determine roles
         roles = ["data"]
@@ -138,26 +158,33 @@ def geocroissant_to_stac(geocroissant_data):
         
         item.add_asset(asset_id, asset)
     
-    # Add spectral band metadata to GEOTIFF assets if present
+    # Add spectral band metadata to GEOTIFF assets if present.  Collect
+    # the eligible assets first so raster:bands is only built when at
+    # least one asset will carry it.
     spectral_bands = geocroissant_data.get("geocr:spectralBandMetadata", [])
-    if spectral_bands:
+    tif_assets = [
+        asset for asset in item.assets.values()
+        if asset.media_type in (MediaType.GEOTIFF, MediaType.COG)
+    ] if spectral_bands else []
+    if tif_assets:
         raster_bands = []
         for band_info in spectral_bands:
             raster_band = {"name": band_info.get("name", "")}
-            
-            center_wl = band_info.get("geocr:centerWavelength", {})
-            if isinstance(center_wl, dict) and center_wl.get("value"):
-                raster_band["center_wavelength"] = float(center_wl["value"])
-            
-            bandwidth = band_info.get("geocr:bandwidth", {})
-            if isinstance(bandwidth, dict) and bandwidth.get("value"):
-                raster_band["bandwidth"] = float(bandwidth["value"])
-            
+
+            try:
+                raster_band["center_wavelength"] = float(band_info["geocr:centerWavelength"]["value"])
+            except (KeyError, TypeError):
+                pass
+
+            try:
+                raster_band["bandwidth"] = float(band_info["geocr:bandwidth"]["value"])
+            except (KeyError, TypeError):
+                pass
+
             raster_bands.append(raster_band)
         
-        # Apply to GEOTIFF assets
-        for asset_key, asset in item.assets.items():
-            if asset.media_type in [MediaType.GEOTIFF, MediaType.COG]:
-                asset.extra_fields["raster:bands"] = raster_bands
+        # Apply to GEOTIFF assets; all share the one list (read-only)
+        for asset in tif_assets:
+            asset.extra_fields["raster:bands"] = raster_bands
     
     return item.to_dict()
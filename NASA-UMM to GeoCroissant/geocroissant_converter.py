@@ -1,391 +1,526 @@
-#!/usr/bin/env python3
-"""
-NASA UMM-G to GeoCroissant Converter
-
-This script converts NASA UMM-G JSON to GeoCroissant format
-"""
-
-import json
-import re
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-
-class CompleteNASAUMMGToGeoCroissantConverter:
-    """Converter that uses only properties defined in the official TTL schemas."""
-    
-    def __init__(self):
-        self.setup_context()
-    
-    def setup_context(self):
-        """Setup the JSON-LD context for GeoCroissant."""
-        self.context = {
-            "@language": "en",
-            "@vocab": "https://schema.org/",
-            "citeAs": "cr:citeAs",
-            "column": "cr:column",
-            "conformsTo": "dct:conformsTo",
-            "cr": "http://mlcommons.org/croissant/",
-            "geocr": "http://mlcommons.org/croissant/geo/",
-            "rai": "http://mlcommons.org/croissant/RAI/",
-            "dct": "http://purl.org/dc/terms/",
-            "sc": "https://schema.org/",
-            "data": {
-                "@id": "cr:data",
-                "@type": "@json"
-            },
-            "examples": {
-                "@id": "cr:examples",
-                "@type": "@json"
-            },
-            "dataBiases": "cr:dataBiases",
-            "dataCollection": "cr:dataCollection",
-            "dataType": {
-                "@id": "cr:dataType",
-                "@type": "@vocab"
-            },
-            "extract": "cr:extract",
-            "field": "cr:field",
-            "fileProperty": "cr:fileProperty",
-            "fileObject": "cr:fileObject",
-            "fileSet": "cr:fileSet",
-            "format": "cr:format",
-            "includes": "cr:includes",
-            "isLiveDataset": "cr:isLiveDataset",
-            "jsonPath": "cr:jsonPath",
-            "key": "cr:key",
-            "md5": "cr:md5",
-            "parentField": "cr:parentField",
-            "path": "cr:path",
-            "personalSensitiveInformation": "cr:personalSensitiveInformation",
-            "recordSet": "cr:recordSet",
-            "references": "cr:references",
-            "regex": "cr:regex",
-            "repeated": "cr:repeated",
-            "replace": "cr:replace",
-            "samplingRate": "cr:samplingRate",
-            "separator": "cr:separator",
-            "source": "cr:source",
-            "subField": "cr:subField",
-            "transform": "cr:transform"
-        }
-    
-    def create_dataset_structure(self, meta: Dict[str, Any], umm: Dict[str, Any]) -> Dict[str, Any]:
-        """Create the main Dataset structure using only TTL-defined properties."""
-        concept_id = meta.get('concept-id')
-        granule_ur = umm.get('GranuleUR', 'HLS_Sentinel2_Dataset')
-        
-        dataset = {
-            "@context": self.context,
-            "@type": "sc:Dataset",
-            "name": granule_ur,
-            "description": umm.get('CollectionReference', {}).get('EntryTitle', 'HLS Sentinel-2 satellite imagery dataset'),
-            "url": f"https://cmr.earthdata.nasa.gov/search/concepts/{concept_id}.html",
-            "datePublished": meta.get('revision-date'),
-            "version": str(meta.get('revision-id', '1.0')),
-            "license": "https://creativecommons.org/publicdomain/zero/1.0/",
-            "citeAs": f"{granule_ur}. NASA EOSDIS Land Processes Distributed Active Archive Center. https://cmr.earthdata.nasa.gov/search/concepts/{concept_id}.html",
-            "conformsTo": [
-                "http://mlcommons.org/croissant/1.1",
-                "http://mlcommons.org/croissant/geo/1.0"
-            ]
-        }
-        
-        # Add GeoCroissant properties at dataset level
-        self.add_geospatial_properties(dataset, umm)
-        self.add_temporal_properties(dataset, umm)
-        self.add_band_properties(dataset, umm)
-        self.add_instrument_properties(dataset, umm)
-        self.add_sampling_properties(dataset, umm)
-        
-        # Add distribution
-        self.add_distribution(dataset, umm)
-        
-        # Add record set
-        dataset["recordSet"] = [self.create_record(meta, umm)]
-        
-        return dataset
-    
-    def create_record(self, meta: Dict[str, Any], umm: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a single record within the RecordSet."""
-        record = {
-            "@type": "cr:RecordSet",
-            "@id": meta.get('concept-id'),
-            "name": umm.get('GranuleUR'),
-            "description": umm.get('CollectionReference', {}).get('EntryTitle')
-        }
-        
-        return record
-    
-    def add_geospatial_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
-        """Add geospatial properties using only TTL-defined properties."""
-        additional_attrs = umm.get('AdditionalAttributes', [])
-        
-        # coordinateReferenceSystem (valid property)
-        crs_code = self.find_additional_attribute(additional_attrs, 'HORIZONTAL_CS_CODE')
-        if crs_code:
-            dataset["geocr:coordinateReferenceSystem"] = crs_code
-        
-        # spatialResolution (valid property - as QuantitativeValue)
-        spatial_resolution = self.find_additional_attribute(additional_attrs, 'SPATIAL_RESOLUTION')
-        if spatial_resolution:
-            dataset["geocr:spatialResolution"] = {
-                "@type": "sc:QuantitativeValue",
-                "value": float(spatial_resolution),
-                "unitText": "m"
-            }
-        
-        # spatialCoverage (schema.org property)
-        spatial_extent = umm.get('SpatialExtent', {})
-        if spatial_extent:
-            horizontal_domain = spatial_extent.get('HorizontalSpatialDomain', {})
-            geometry = horizontal_domain.get('Geometry', {})
-            polygons = geometry.get('GPolygons', [])
-            
-            if polygons:
-                points = polygons[0].get('Boundary', {}).get('Points', [])
-                if points:
-                    bbox = self.calculate_bounding_box(points)
-                    if bbox:
-                        dataset["spatialCoverage"] = {
-                            "@type": "sc:Place",
-                            "geo": {
-                                "@type": "sc:GeoShape",
-                                "box": f"{bbox['south']} {bbox['west']} {bbox['north']} {bbox['east']}"
-                            }
-                        }
-    
-    def add_temporal_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
-        """Add temporal properties using only TTL-defined properties."""
-        temporal_extent = umm.get('TemporalExtent', {})
-        if temporal_extent:
-            range_datetime = temporal_extent.get('RangeDateTime', {})
-            if range_datetime:
-                start = range_datetime.get('BeginningDateTime')
-                end = range_datetime.get('EndingDateTime')
-                if start and end:
-                    # temporalCoverage (schema.org property)
-                    dataset["temporalCoverage"] = f"{start}/{end}"
-    
-    def add_band_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
-        """Add band configuration and spectral metadata using TTL-defined properties."""
-        # bandConfiguration (valid property)
-        dataset["geocr:bandConfiguration"] = {
-            "@type": "geocr:BandConfiguration",
-            "geocr:totalBands": 13,
-            "geocr:bandNamesList": ["B01", "B02", "B03", "B04", "B05", "B06", "B07", "B08", "B8A", "B09", "B10", "B11", "B12"]
-        }
-        
-        # spectralBandMetadata (valid property)
-        band_info = {
-            "B01": {"wavelength": 443, "bandwidth": 65, "description": "Coastal aerosol"},
-            "B02": {"wavelength": 490, "bandwidth": 65, "description": "Blue"},
-            "B03": {"wavelength": 560, "bandwidth": 60, "description": "Green"},
-            "B04": {"wavelength": 665, "bandwidth": 30, "description": "Red"},
-            "B05": {"wavelength": 705, "bandwidth": 15, "description": "Red edge 1"},
-            "B06": {"wavelength": 740, "bandwidth": 15, "description": "Red edge 2"},
-            "B07": {"wavelength": 783, "bandwidth": 20, "description": "Red edge 3"},
-            "B08": {"wavelength": 842, "bandwidth": 115, "description": "NIR"},
-            "B8A": {"wavelength": 865, "bandwidth": 20, "description": "NIR narrow"},
-            "B09": {"wavelength": 945, "bandwidth": 20, "description": "Water vapour"},
-            "B10": {"wavelength": 1375, "bandwidth": 30, "description": "SWIR cirrus"},
-            "B11": {"wavelength": 1610, "bandwidth": 90, "description": "SWIR 1"},
-            "B12": {"wavelength": 2190, "bandwidth": 180, "description": "SWIR 2"}
-        }
-        
-        spectral_bands = []
-        for band_name, info in band_info.items():
-            spectral_bands.append({
-                "@type": "geocr:SpectralBand",
-                "name": band_name,
-                "description": info["description"],
-                "geocr:centerWavelength": {
-                    "@type": "sc:QuantitativeValue",
-                    "value": info["wavelength"],
-                    "unitText": "nm"
-                },
-                "geocr:bandwidth": {
-                    "@type": "sc:QuantitativeValue",
-                    "value": info["bandwidth"],
-                    "unitText": "nm"
-                }
-            })
-        
-        dataset["geocr:spectralBandMetadata"] = spectral_bands
-    
-    def add_instrument_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
-        """Add instrument and observatory properties using TTL-defined properties."""
-        platforms = umm.get('Platforms', [])
-        if platforms:
-            platform = platforms[0]
-            instruments = platform.get('Instruments', [])
-            
-            if instruments:
-                # solarInstrumentCharacteristics (valid for space weather, but can be used here)
-                dataset["geocr:solarInstrumentCharacteristics"] = {
-                    "@type": "geocr:SolarInstrumentCharacteristics",
-                    "geocr:observatory": platform.get('ShortName'),
-                    "geocr:instrument": instruments[0].get('ShortName')
-                }
-    
-    def add_sampling_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
-        """Add sampling strategy using TTL-defined properties."""
-        additional_attrs = umm.get('AdditionalAttributes', [])
-        
-        # samplingStrategy (valid property)
-        spatial_coverage = self.find_additional_attribute(additional_attrs, 'SPATIAL_COVERAGE')
-        if spatial_coverage:
-            dataset["geocr:samplingStrategy"] = f"Spatial coverage: {spatial_coverage}%"
-    
-    def add_distribution(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
-        """Add distribution information using schema.org properties."""
-        distributions = []
-        
-        # Get all related URLs
-        related_urls = umm.get('RelatedUrls', [])
-        
-        for url_info in related_urls:
-            url = url_info.get('URL', '')
-            url_type = url_info.get('Type', '')
-            subtype = url_info.get('Subtype', '')
-            description = url_info.get('Description', '')
-            
-            # Determine encoding format based on URL or type
-            encoding_format = self.determine_encoding_format(url, url_type, subtype)
-            
-            distribution = {
-                "@type": "cr:FileObject",
-                "name": url.split('/')[-1] or "data_file",
-                "contentUrl": url,
-                "encodingFormat": encoding_format,
-                "sha256": "https://github.com/mlcommons/croissant/issues/80",
-                "description": description or f"Download {url.split('/')[-1]}"
-            }
-            
-            distributions.append(distribution)
-        
-        if distributions:
-            dataset["distribution"] = distributions
-    
-    def convert_polygon_to_wkt(self, points: List[Dict[str, float]]) -> str:
-        """Convert polygon points to WKT format."""
-        if not points:
-            return ""
-        
-        coords = []
-        for point in points:
-            lon = point.get('Longitude', 0)
-            lat = point.get('Latitude', 0)
-            coords.append(f"{lon} {lat}")
-        
-        if coords and coords[0] != coords[-1]:
-            coords.append(coords[0])
-        
-        return f"POLYGON(({', '.join(coords)}))"
-    
-    def calculate_bounding_box(self, points: List[Dict[str, float]]) -> Dict[str, float]:
-        """Calculate bounding box from polygon points."""
-        if not points:
-            return {}
-        
-        lons = [p.get('Longitude', 0) for p in points]
-        lats = [p.get('Latitude', 0) for p in points]
-        
-        return {
-            "west": min(lons),
-            "south": min(lats),
-            "east": max(lons),
-            "north": max(lats)
-        }
-    
-    def find_additional_attribute(self, attributes: List[Dict], name: str) -> Optional[str]:
-        """Find value of additional attribute by name."""
-        for attr in attributes:
-            if attr.get('Name') == name:
-                values = attr.get('Values', [])
-                return values[0] if values else None
-        return None
-    
-    def find_additional_attribute_values(self, attributes: List[Dict], name: str) -> List[str]:
-        """Find all values of additional attribute by name."""
-        for attr in attributes:
-            if attr.get('Name') == name:
-                return attr.get('Values', [])
-        return []
-    
-    def determine_encoding_format(self, url: str, url_type: str, subtype: str) -> str:
-        """Determine the encoding format based on URL and type."""
-        if url.endswith('.tif') or url.endswith('.tiff'):
-            return "image/tiff"
-        elif url.endswith('.jpg') or url.endswith('.jpeg'):
-            return "image/jpeg"
-        elif url.endswith('.json'):
-            return "application/json"
-        elif url.endswith('.xml'):
-            return "application/xml"
-        elif url.endswith('.hdf') or url.endswith('.h5'):
-            return "application/x-hdf"
-        elif url.endswith('.nc'):
-            return "application/x-netcdf"
-        elif 's3credentials' in url:
-            return "application/octet-stream"
-        else:
-            return "application/octet-stream"
-    
-    def convert_to_complete_geocroissant(self, ummg_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Main conversion method - using only TTL-defined properties."""
-        # Extract main sections
-        meta = ummg_data.get('meta', {})
-        umm = ummg_data.get('umm', {})
-        
-        # Create the complete GeoCroissant structure
-        return self.create_dataset_structure(meta, umm)
-
-def main():
-    """Main function to demonstrate conversion using only TTL-defined properties."""
-    
-    # Load the NASA UMM-G JSON
-    with open('nasa_ummg_h.json', 'r') as f:
-        ummg_data = json.load(f)
-    
-    # Convert to GeoCroissant using only TTL properties
-    converter = CompleteNASAUMMGToGeoCroissantConverter()
-    geocroissant_data = converter.convert_to_complete_geocroissant(ummg_data)
-    
-    # Save the converted data
-    with open('geocroissant_output.json', 'w') as f:
-        json.dump(geocroissant_data, f, indent=2)
-    
-    print("Conversion completed using only TTL-defined properties!")
-    print(f"Input: nasa_ummg_h.json")
-    print(f"Output: geocroissant_output.json")
-    
-    # Print statistics
-    print("\nGeoCroissant Properties Used (from TTL):")
-    ttl_properties = [
-        "geocr:coordinateReferenceSystem",
-        "geocr:spatialResolution",
-        "geocr:temporalResolution",
-        "geocr:bandConfiguration",
-        "geocr:spectralBandMetadata",
-        "geocr:samplingStrategy",
-        "geocr:solarInstrumentCharacteristics"
-    ]
-    
-    for prop in ttl_properties:
-        if prop in str(geocroissant_data):
-            print(f"  ✓ {prop}")
-    
-    print("\nSchema.org Properties Used:")
-    schema_properties = [
-        "spatialCoverage",
-        "temporalCoverage",
-        "distribution"
-    ]
-    
-    for prop in schema_properties:
-        if prop in str(geocroissant_data):
-            print(f"  ✓ {prop}")
-    
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+NASA UMM-G to GeoCroissant Converter
+
+This script converts NASA UMM-G JSON to GeoCroissant format
+"""
+
+import functools
+import json
+import os
+import re
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# File-extension to MIME-type dispatch; one dict lookup replaces the
+# endswith ladder in determine_encoding_format
+_EXT_TO_MIME = {
+    '.tif': 'image/tiff',
+    '.tiff': 'image/tiff',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.hdf': 'application/x-hdf',
+    '.h5': 'application/x-hdf',
+    '.nc': 'application/x-netcdf',
+}
+
+# Sentinel-2 band metadata is static (not input-dependent), so the band
+# configuration and geocr:SpectralBand entries are built once at import
+# and shared by reference across conversions.  Consumers treat the
+# emitted dataset as read-only, so no defensive copy is made.
+#
+# The table is stored as compact (name, description, wavelength_nm,
+# bandwidth_nm) rows rather than nested dicts; the JSON-LD shape is
+# produced per row by _band_row_to_jsonld.
+_S2_BAND_TABLE = (
+    ("B01", "Coastal aerosol", 443, 65),
+    ("B02", "Blue", 490, 65),
+    ("B03", "Green", 560, 60),
+    ("B04", "Red", 665, 30),
+    ("B05", "Red edge 1", 705, 15),
+    ("B06", "Red edge 2", 740, 15),
+    ("B07", "Red edge 3", 783, 20),
+    ("B08", "NIR", 842, 115),
+    ("B8A", "NIR narrow", 865, 20),
+    ("B09", "Water vapour", 945, 20),
+    ("B10", "SWIR cirrus", 1375, 30),
+    ("B11", "SWIR 1", 1610, 90),
+    ("B12", "SWIR 2", 2190, 180),
+)
+
+
+def _points_to_array(points):
+    """Parse UMM-G boundary points into an (N, 2) lon/lat float64 array."""
+    return np.fromiter(
+        (v for p in points for v in (p.get('Longitude', 0.0), p.get('Latitude', 0.0))),
+        dtype=np.float64,
+        count=2 * len(points),
+    ).reshape(-1, 2)
+
+
+def _band_row_to_jsonld(name, description, wavelength, bandwidth):
+    """Expand one band-table row to its geocr:SpectralBand JSON-LD dict."""
+    return {
+        "@type": "geocr:SpectralBand",
+        "name": name,
+        "description": description,
+        "geocr:centerWavelength": {
+            "@type": "sc:QuantitativeValue",
+            "value": wavelength,
+            "unitText": "nm"
+        },
+        "geocr:bandwidth": {
+            "@type": "sc:QuantitativeValue",
+            "value": bandwidth,
+            "unitText": "nm"
+        }
+    }
+
+
+_S2_BAND_CONFIG = {
+    "@type": "geocr:BandConfiguration",
+    "geocr:totalBands": len(_S2_BAND_TABLE),
+    "geocr:bandNamesList": [row[0] for row in _S2_BAND_TABLE]
+}
+
+@functools.lru_cache(maxsize=1)
+def _s2_spectral_bands():
+    """Expand the band table to geocr:SpectralBand entries (built lazily,
+    once per process, and shared across all conversions)."""
+    return [_band_row_to_jsonld(*row) for row in _S2_BAND_TABLE]
+
+# JSON-LD context for GeoCroissant.  The mapping is input-independent,
+# so it is built once at import and shared across converter instances.
+# It stays a plain dict (not a MappingProxyType) because it is embedded
+# in the output document and handed to JSON serializers directly.
+_GEOCR_CONTEXT = {
+    "@language": "en",
+    "@vocab": "https://schema.org/",
+    "citeAs": "cr:citeAs",
+    "column": "cr:column",
+    "conformsTo": "dct:conformsTo",
+    "cr": "http://mlcommons.org/croissant/",
+    "geocr": "http://mlcommons.org/croissant/geo/",
+    "rai": "http://mlcommons.org/croissant/RAI/",
+    "dct": "http://purl.org/dc/terms/",
+    "sc": "https://schema.org/",
+    "data": {
+        "@id": "cr:data",
+        "@type": "@json"
+    },
+    "examples": {
+        "@id": "cr:examples",
+        "@type": "@json"
+    },
+    "dataBiases": "cr:dataBiases",
+    "dataCollection": "cr:dataCollection",
+    "dataType": {
+        "@id": "cr:dataType",
+        "@type": "@vocab"
+    },
+    "extract": "cr:extract",
+    "field": "cr:field",
+    "fileProperty": "cr:fileProperty",
+    "fileObject": "cr:fileObject",
+    "fileSet": "cr:fileSet",
+    "format": "cr:format",
+    "includes": "cr:includes",
+    "isLiveDataset": "cr:isLiveDataset",
+    "jsonPath": "cr:jsonPath",
+    "key": "cr:key",
+    "md5": "cr:md5",
+    "parentField": "cr:parentField",
+    "path": "cr:path",
+    "personalSensitiveInformation": "cr:personalSensitiveInformation",
+    "recordSet": "cr:recordSet",
+    "references": "cr:references",
+    "regex": "cr:regex",
+    "repeated": "cr:repeated",
+    "replace": "cr:replace",
+    "samplingRate": "cr:samplingRate",
+    "separator": "cr:separator",
+    "source": "cr:source",
+    "subField": "cr:subField",
+    "transform": "cr:transform"
+}
+
+
+# URL and citation templates, parsed once at import instead of per
+# conversion; batch runs expand these for every granule
+_URL_TMPL = "https://cmr.earthdata.nasa.gov/search/concepts/{cid}.html"
+_CITE_TMPL = ("{ur}. NASA EOSDIS Land Processes Distributed Active Archive Center. "
+              + _URL_TMPL)
+
+
+class CompleteNASAUMMGToGeoCroissantConverter:
+    """Converter that uses only properties defined in the official TTL schemas."""
+
+    def __init__(self):
+        self.context = _GEOCR_CONTEXT
+        self._attr_index = {}
+
+    def create_dataset_structure(self, meta: Dict[str, Any], umm: Dict[str, Any]) -> Dict[str, Any]:
+        """Create the main Dataset structure using only TTL-defined properties."""
+        concept_id = meta.get('concept-id')
+        granule_ur = umm.get('GranuleUR', 'HLS_Sentinel2_Dataset')
+        entry_title = (umm.get('CollectionReference') or {}).get('EntryTitle')
+
+        # Index AdditionalAttributes by name once; every subsequent lookup
+        # is then O(1) instead of a full list scan per attribute
+        self._attr_index = {
+            attr.get('Name'): attr.get('Values', [])
+            for attr in umm.get('AdditionalAttributes', [])
+        }
+
+        dataset = {
+            "@context": self.context,
+            "@type": "sc:Dataset",
+            "name": granule_ur,
+            "description": entry_title or 'HLS Sentinel-2 satellite imagery dataset',
+            "url": _URL_TMPL.format(cid=concept_id),
+            "datePublished": meta.get('revision-date'),
+            "version": str(meta.get('revision-id', '1.0')),
+            "license": "https://creativecommons.org/publicdomain/zero/1.0/",
+            "citeAs": _CITE_TMPL.format(ur=granule_ur, cid=concept_id),
+            "conformsTo": [
+                "http://mlcommons.org/croissant/1.1",
+                "http://mlcommons.org/croissant/geo/1.0"
+            ]
+        }
+        
+        # Add GeoCroissant properties at dataset level
+        self.add_geospatial_properties(dataset, umm)
+        self.add_temporal_properties(dataset, umm)
+        self.add_band_properties(dataset, umm)
+        self.add_instrument_properties(dataset, umm)
+        self.add_sampling_properties(dataset, umm)
+        
+        # Add distribution
+        self.add_distribution(dataset, umm)
+        
+        # Add record set
+        dataset["recordSet"] = [self.create_record(concept_id, granule_ur, entry_title)]
+
+        return dataset
+
+    def create_record(self, concept_id: Optional[str], granule_ur: str,
+                      entry_title: Optional[str]) -> Dict[str, Any]:
+        """Create a single record within the RecordSet."""
+        return {
+            "@type": "cr:RecordSet",
+            "@id": concept_id,
+            "name": granule_ur,
+            "description": entry_title
+        }
+    
+    def add_geospatial_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
+        """Add geospatial properties using only TTL-defined properties."""
+        # coordinateReferenceSystem (valid property)
+        crs_code = self.find_additional_attribute('HORIZONTAL_CS_CODE')
+        if crs_code:
+            dataset["geocr:coordinateReferenceSystem"] = crs_code
+
+        # spatialResolution (valid property - as QuantitativeValue)
+        spatial_resolution = self.find_additional_attribute('SPATIAL_RESOLUTION')
+        if spatial_resolution:
+            dataset["geocr:spatialResolution"] = {
+                "@type": "sc:QuantitativeValue",
+                "value": float(spatial_resolution),
+                "unitText": "m"
+            }
+        
+        # spatialCoverage (schema.org property)
+        spatial_extent = umm.get('SpatialExtent', {})
+        if spatial_extent:
+            horizontal_domain = spatial_extent.get('HorizontalSpatialDomain', {})
+            geometry = horizontal_domain.get('Geometry', {})
+            polygons = geometry.get('GPolygons', [])
+            
+            if polygons:
+                points = polygons[0].get('Boundary', {}).get('Points', [])
+                if points:
+                    bbox = self.calculate_bounding_box(points)
+                    if bbox:
+                        dataset["spatialCoverage"] = {
+                            "@type": "sc:Place",
+                            "geo": {
+                                "@type": "sc:GeoShape",
+                                "box": f"{bbox['south']} {bbox['west']} {bbox['north']} {bbox['east']}"
+                            }
+                        }
+    
+    def add_temporal_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
+        """Add temporal properties using only TTL-defined properties."""
+        temporal_extent = umm.get('TemporalExtent', {})
+        if temporal_extent:
+            range_datetime = temporal_extent.get('RangeDateTime', {})
+            if range_datetime:
+                start = range_datetime.get('BeginningDateTime')
+                end = range_datetime.get('EndingDateTime')
+                if start and end:
+                    # temporalCoverage (schema.org property)
+                    dataset["temporalCoverage"] = f"{start}/{end}"
+    
+    def add_band_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
+        """Add band configuration and spectral metadata using TTL-defined properties."""
+        # bandConfiguration (valid property)
+        dataset["geocr:bandConfiguration"] = _S2_BAND_CONFIG
+
+        # spectralBandMetadata (valid property) - static Sentinel-2
+        # metadata, built once per process and shared by reference
+        dataset["geocr:spectralBandMetadata"] = _s2_spectral_bands()
+    
+    def add_instrument_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
+        """Add instrument and observatory properties using TTL-defined properties."""
+        platforms = umm.get('Platforms', [])
+        if platforms:
+            platform = platforms[0]
+            instruments = platform.get('Instruments', [])
+            
+            if instruments:
+                # solarInstrumentCharacteristics (valid for space weather, but can be used here)
+                dataset["geocr:solarInstrumentCharacteristics"] = {
+                    "@type": "geocr:SolarInstrumentCharacteristics",
+                    "geocr:observatory": platform.get('ShortName'),
+                    "geocr:instrument": instruments[0].get('ShortName')
+                }
+    
+    def add_sampling_properties(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
+        """Add sampling strategy using TTL-defined properties."""
+        # samplingStrategy (valid property)
+        spatial_coverage = self.find_additional_attribute('SPATIAL_COVERAGE')
+        if spatial_coverage:
+            dataset["geocr:samplingStrategy"] = f"Spatial coverage: {spatial_coverage}%"
+    
+    def add_distribution(self, dataset: Dict[str, Any], umm: Dict[str, Any]):
+        """Add distribution information using schema.org properties."""
+        # Get all related URLs; the FileObject list is pre-sized since
+        # the count is known up front, avoiding append-resize churn
+        related_urls = umm.get('RelatedUrls', [])
+        distributions = [None] * len(related_urls)
+
+        for i, url_info in enumerate(related_urls):
+            url = url_info.get('URL', '')
+            url_type = url_info.get('Type', '')
+            subtype = url_info.get('Subtype', '')
+            description = url_info.get('Description', '')
+            filename = url.rsplit('/', 1)[-1]
+
+            # Determine encoding format based on URL or type
+            encoding_format = self.determine_encoding_format(url, url_type, subtype)
+
+            distributions[i] = {
+                "@type": "cr:FileObject",
+                "name": filename or "data_file",
+                "contentUrl": url,
+                "encodingFormat": encoding_format,
+                "sha256": "https://github.com/mlcommons/croissant/issues/80",
+                "description": description or f"Download {filename}"
+            }
+
+        if distributions:
+            dataset["distribution"] = distributions
+    
+    def convert_polygon_to_wkt(self, points: List[Dict[str, float]]) -> str:
+        """Convert polygon points to WKT format."""
+        if not points:
+            return ""
+        
+        # Same single-pass array parse as calculate_bounding_box; the
+        # coordinates render uniformly as float64 values
+        arr = _points_to_array(points)
+
+        # Close the ring by numeric comparison, not on the formatted
+        # strings - float values that format differently still compare
+        # equal here
+        if not np.array_equal(arr[0], arr[-1]):
+            arr = np.vstack([arr, arr[:1]])
+
+        coords = ', '.join(f"{lon} {lat}" for lon, lat in arr.tolist())
+        return f"POLYGON(({coords}))"
+    
+    def calculate_bounding_box(self, points: List[Dict[str, float]]) -> Dict[str, float]:
+        """Calculate bounding box from polygon points."""
+        if not points:
+            return {}
+
+        # One pass over the points into an (N, 2) array, then a single
+        # vectorized reduction per edge instead of four interpreted scans
+        coords = _points_to_array(points)
+        west, south = coords.min(axis=0)
+        east, north = coords.max(axis=0)
+
+        return {
+            "west": west,
+            "south": south,
+            "east": east,
+            "north": north
+        }
+    
+    def find_additional_attribute(self, name: str) -> Optional[str]:
+        """Find first value of additional attribute by name."""
+        values = self._attr_index.get(name)
+        return values[0] if values else None
+
+    def find_additional_attribute_values(self, name: str) -> List[str]:
+        """Find all values of additional attribute by name."""
+        return self._attr_index.get(name, [])
+    
+    def determine_encoding_format(self, url: str, url_type: str, subtype: str) -> str:
+        """Determine the encoding format based on URL and type."""
+        # Drop any query string / fragment first so an extension that is
+        # not the final URL segment (e.g. followed by a signing token)
+        # still classifies; each partition is a single C-level scan
+        path = url.partition('?')[0].partition('#')[0]
+        ext = path.rpartition('.')[2].lower()
+        return _EXT_TO_MIME.get('.' + ext, "application/octet-stream")
+    
+    def stream_dataset_to_file(self, dataset: Dict[str, Any], path: str):
+        """Write *dataset* to *path*, streaming one top-level section at a time.
+
+        A single dumps call materializes the whole document as one byte
+        string on top of the dict, doubling peak memory for granules with
+        many RelatedUrls.  Emitting per top-level key keeps the
+        serialization working set bounded by the largest section (usually
+        the distribution list).
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(obj):
+                return json.dumps(obj).encode()
+
+        with open(path, 'wb', buffering=1 << 20) as f:
+            write = f.write
+            write(b"{")
+            first = True
+            for key, value in dataset.items():
+                if not first:
+                    write(b",")
+                first = False
+                write(dumps(key))
+                write(b":")
+                write(dumps(value))
+            write(b"}")
+
+    def convert_to_complete_geocroissant(self, ummg_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Main conversion method - using only TTL-defined properties."""
+        # Extract main sections
+        meta = ummg_data.get('meta', {})
+        umm = ummg_data.get('umm', {})
+        
+        # Create the complete GeoCroissant structure
+        return self.create_dataset_structure(meta, umm)
+
+def _collect_keys(obj, out):
+    """Recursively gather every dict key in *obj* into the set *out*."""
+    if isinstance(obj, dict):
+        out.update(obj.keys())
+        for value in obj.values():
+            _collect_keys(value, out)
+    elif isinstance(obj, list):
+        for value in obj:
+            _collect_keys(value, out)
+
+
+def _convert_one(path):
+    """Convert a single UMM-G file, writing the result next to it.
+
+    Module-level so ProcessPoolExecutor can pickle it by reference.
+    """
+    converter = CompleteNASAUMMGToGeoCroissantConverter()
+    raw = Path(path).read_bytes()
+    ummg_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    geocroissant_data = converter.convert_to_complete_geocroissant(ummg_data)
+    out_path = Path(path).with_suffix('.geocr.json')
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(geocroissant_data, option=orjson.OPT_INDENT_2))
+    else:
+        out_path.write_text(json.dumps(geocroissant_data, indent=2))
+    return str(out_path)
+
+
+def main_batch(paths):
+    """Convert many UMM-G files in parallel, one worker process per core.
+
+    Each conversion is independent and dominated by JSON parsing and dict
+    building, so wall-clock time scales near-linearly with core count.
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        outputs = list(ex.map(_convert_one, paths, chunksize=8))
+    print(f"Converted {len(outputs)} UMM-G files")
+    return outputs
+
+
+def main():
+    """Main function to demonstrate conversion using only TTL-defined properties."""
+    
+    # Load the NASA UMM-G JSON: one read syscall plus one parse, with
+    # orjson's compiled parser when available
+    raw = Path('nasa_ummg_h.json').read_bytes()
+    ummg_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
+    # Convert to GeoCroissant using only TTL properties
+    converter = CompleteNASAUMMGToGeoCroissantConverter()
+    geocroissant_data = converter.convert_to_complete_geocroissant(ummg_data)
+    
+    # Save the converted data; orjson's compiled encoder is several times
+    # faster than stdlib json for these deeply nested documents
+    if orjson is not None:
+        Path('geocroissant_output.json').write_bytes(
+            orjson.dumps(geocroissant_data, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump emits tiny chunks around indent whitespace (one write
+        # call each); serialize to a single string and write it once
+        Path('geocroissant_output.json').write_text(
+            json.dumps(geocroissant_data, indent=2))
+    
+    print("Conversion completed using only TTL-defined properties!")
+    print(f"Input: nasa_ummg_h.json")
+    print(f"Output: geocroissant_output.json")
+    
+    # Print statistics; a single recursive key walk replaces the
+    # per-property substring search over str(geocroissant_data), which
+    # re-rendered the whole document for every check
+    used_keys = set()
+    _collect_keys(geocroissant_data, used_keys)
+
+    print("\nGeoCroissant Properties Used (from TTL):")
+    ttl_properties = [
+        "geocr:coordinateReferenceSystem",
+        "geocr:spatialResolution",
+        "geocr:temporalResolution",
+        "geocr:bandConfiguration",
+        "geocr:spectralBandMetadata",
+        "geocr:samplingStrategy",
+        "geocr:solarInstrumentCharacteristics"
+    ]
+    
+    for prop in ttl_properties:
+        if prop in used_keys:
+            print(f"  ✓ {prop}")
+    
+    print("\nSchema.org Properties Used:")
+    schema_properties = [
+        "spatialCoverage",
+        "temporalCoverage",
+        "distribution"
+    ]
+    
+    for prop in schema_properties:
+        if prop in used_keys:
+            print(f"  ✓ {prop}")
+    
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,144 @@ import argparse
 import json
 import os
 import re
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain
 from pathlib import Path
-import pytdml
-import pytdml.io
-from pytdml.type.extended_types import EOTrainingDataset, AI_EOTrainingData, AI_PixelLabel, MD_Band, AI_EOTask
+import numpy as np
+from pytdml.type.extended_types import AI_EOTrainingData, AI_PixelLabel, MD_Band, AI_EOTask
 from pytdml.type.basic_types import NamedValue, MD_Identifier
 
-def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path):
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Suffix strippers used when pairing image/mask files; compiled once
+# instead of hitting re's cache on every path
+_MERGED_SUFFIX_RE = re.compile(r'_merged\.tif$')
+_MASK_SUFFIX_RE = re.compile(r'\.mask\.tif$')
+
+# Default field patterns are plain suffix tests; matched with
+# str.endswith instead of the regex engine when unchanged
+_DEFAULT_IMAGE_PATTERN = '.*_merged\\.tif$'
+_DEFAULT_MASK_PATTERN = '.*\\.mask\\.tif$'
+
+
+def _pattern_matcher(pattern, default_pattern, suffix):
+    """Return a filename predicate for *pattern*, or None if falsy.
+
+    The default patterns only test a suffix, so they skip the regex
+    engine entirely; custom patterns get a precompiled search.
+    """
+    if not pattern:
+        return None
+    if pattern == default_pattern:
+        return lambda name: name.endswith(suffix)
+    return re.compile(pattern).search
+
+
+def _iter_files(root):
+    """Yield (name, path) for every regular file under *root*.
+
+    os.scandir reuses the directory entry's cached type information, so
+    this avoids the per-entry stat calls and per-directory list
+    allocations of os.walk.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.name, entry.path
+
+
+def _scan_dir(path):
+    """Scan one directory, returning its (name, path) files and subdirs."""
+    files = []
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                files.append((entry.name, entry.path))
+    return files, subdirs
+
+
+def _iter_files_threaded(root, max_workers):
+    """Yield (name, path) for every regular file under *root*, scanning
+    directories concurrently.
+
+    Each readdir blocks on round-trip latency, so on cold caches or
+    network filesystems keeping several scans in flight cuts wall time.
+    On a local SSD serial scandir is already saturated, which is why
+    callers only pick this path when concurrency > 1.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        pending = {ex.submit(_scan_dir, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                yield from files
+                for subdir in subdirs:
+                    pending.add(ex.submit(_scan_dir, subdir))
+
+# Provider-name extraction keyed on the creator's concrete type; one dict
+# lookup replaces the isinstance ladder
+_get_provider_names = {
+    dict: lambda c: [c.get("name", "Unknown")],
+    list: lambda c: [x.get("name", "Unknown") if isinstance(x, dict) else str(x) for x in c],
+}
+
+def _write_tdml_streaming(path, header, data_iter):
+    """Write a TDML JSON document, streaming the data array.
+
+    *header* holds the already-serialized dataset-level fields; entries
+    from *data_iter* are encoded and written one at a time, so only a
+    single AI_EOTrainingData object is alive at any point instead of the
+    whole O(N) list pytdml.io.write_to_json would walk. Returns the
+    number of data entries written.
+    """
+    # orjson encodes each chunk several times faster than stdlib json;
+    # both emit UTF-8 bytes here so the file is opened in binary mode
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(value):
+            return json.dumps(value).encode()
+
+    n = 0
+    with open(path, 'wb') as f:
+        write = f.write
+        write(b'{')
+        first = True
+        for key, value in header.items():
+            if value is None:
+                continue
+            if not first:
+                write(b',')
+            first = False
+            write(dumps(key))
+            write(b':')
+            write(dumps(value))
+        write(b',"data":[')
+        for entry in data_iter:
+            if n:
+                write(b',')
+            write(dumps(entry.to_dict()))
+            n += 1
+        write(b'],"amountOfTrainingData":')
+        write(str(n).encode())
+        write(b'}')
+    return n
+
+
+def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path,
+                                             concurrency=1):
     # Load GeoCroissant JSON directly
     with open(geocroissant_path) as f:
         croissant = json.load(f)
@@ -23,12 +154,7 @@ def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path
     
     # Handle creator/providers (schema:creator)
     creator = croissant.get("creator", {})
-    if isinstance(creator, dict):
-        providers = [creator.get("name", "Unknown")]
-    elif isinstance(creator, list):
-        providers = [c.get("name", "Unknown") if isinstance(c, dict) else str(c) for c in creator]
-    else:
-        providers = []
+    providers = _get_provider_names.get(type(creator), lambda _: [])(creator)
     
     # Handle dates (schema:dateCreated, schema:dateModified, schema:datePublished)
     created_time = croissant.get("dateCreated", "") or croissant.get("datePublished", "2025-07-17")
@@ -46,19 +172,20 @@ def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path
             # Handle box format: "minLat minLon maxLat maxLon"
             box = geo.get("box")
             if box:
-                coords = [float(x) for x in box.split()]
-                if len(coords) == 4:
+                coords = np.array(box.split(), dtype=np.float64)
+                if coords.size == 4:
                     # box format is: minLat minLon maxLat maxLon
                     # extent format is: [minLon, minLat, maxLon, maxLat]
-                    extent = [coords[1], coords[0], coords[3], coords[2]]
+                    extent = coords[[1, 0, 3, 2]].tolist()
             # Handle coordinates format (polygon)
             elif "coordinates" in geo:
                 coords = geo.get("coordinates", [[]])[0]
                 if coords and len(coords) > 0:
-                    min_x = min(c[0] for c in coords)
-                    min_y = min(c[1] for c in coords)
-                    max_x = max(c[0] for c in coords)
-                    max_y = max(c[1] for c in coords)
+                    # One vectorized min/max pair over the ring instead of
+                    # four generator-expression reductions
+                    arr = np.asarray(coords, dtype=np.float64)
+                    min_x, min_y = arr.min(axis=0)
+                    max_x, max_y = arr.max(axis=0)
                     extent = [min_x, min_y, max_x, max_y]
     
     # Extract bands from geocr:spectralBandMetadata
@@ -95,9 +222,11 @@ def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path
     classes = []
     keywords = croissant.get("keywords", [])
     
-    # Look for class information in the dataset name or keywords
-    dataset_name_lower = name.lower()
-    if "burn" in dataset_name_lower or any("burn" in str(k).lower() for k in keywords):
+    # Look for class information in the dataset name or keywords; one
+    # joined lowercase string gives a single substring scan instead of a
+    # str/lower/in round per keyword
+    searchable = name.lower() + ' ' + ' '.join(str(k) for k in keywords).lower()
+    if "burn" in searchable:
         # Burn scar segmentation classes
         classes = [
             NamedValue(key="background", name="background", value=0),
@@ -136,59 +265,60 @@ def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path
     # The actual data references are in the recordSet fields via source
     distribution = croissant.get("distribution", [])
     
-    # Parse FileSet to get file patterns (if needed for TDML)
-    # For now, we'll create placeholder data entries since the actual file enumeration
-    # would require accessing the file system
-    data = []
-    
-    # Check if there are actual file URLs in distribution (legacy format)
-    has_legacy_distribution = False
+    # Data entries are produced lazily; the generators below yield one
+    # AI_EOTrainingData at a time so the streaming writer never holds the
+    # full training-data list in memory
+    data_iter = None
+
+    # One pass over distribution: collect legacy direct-URL entries and
+    # the first FileObject base path together, instead of one scan to
+    # detect the format and another per branch
+    legacy_dists = []
+    base_path = ""
     for dist in distribution:
-        if isinstance(dist, dict) and dist.get("@type") not in ["cr:FileObject", "cr:FileSet"]:
-            has_legacy_distribution = True
-            break
-    
-    if has_legacy_distribution:
+        if not isinstance(dist, dict):
+            continue
+        dist_type = dist.get("@type")
+        if dist_type == "cr:FileObject":
+            if not base_path:
+                base_path = dist.get("contentUrl", "")
+        elif dist_type != "cr:FileSet":
+            legacy_dists.append(dist)
+
+    if legacy_dists:
         # Legacy format: distribution contains direct file URLs
-        for i in range(0, len(distribution), 2):
-            img_entry = distribution[i]
-            mask_entry = distribution[i+1] if i+1 < len(distribution) else None
-            
-            if not isinstance(img_entry, dict):
-                continue
-                
-            img_url = img_entry.get("contentUrl", "")
-            data_id = f"data_{i//2}"
-            labels = []
-            
-            if mask_entry and isinstance(mask_entry, dict):
-                mask_url = mask_entry.get("contentUrl", "")
-                mask_format = mask_entry.get("encodingFormat", "image/tiff")
-                labels = [AI_PixelLabel(
-                    type="AI_PixelLabel",
-                    image_url=[mask_url],
-                    image_format=[mask_format],
-                    class_=""
-                )]
-            
-            data.append(AI_EOTrainingData(
-                type="AI_EOTrainingData",
-                id=data_id,
-                data_url=[img_url],
-                labels=labels
-            ))
+        def _legacy_entries():
+            for i in range(0, len(legacy_dists), 2):
+                img_entry = legacy_dists[i]
+                mask_entry = legacy_dists[i+1] if i+1 < len(legacy_dists) else None
+
+                img_url = img_entry.get("contentUrl", "")
+                data_id = f"data_{i//2}"
+                labels = []
+
+                if mask_entry and isinstance(mask_entry, dict):
+                    mask_url = mask_entry.get("contentUrl", "")
+                    mask_format = mask_entry.get("encodingFormat", "image/tiff")
+                    labels = [AI_PixelLabel(
+                        type="AI_PixelLabel",
+                        image_url=[mask_url],
+                        image_format=[mask_format],
+                        class_=""
+                    )]
+
+                yield AI_EOTrainingData(
+                    type="AI_EOTrainingData",
+                    id=data_id,
+                    data_url=[img_url],
+                    labels=labels
+                )
+
+        data_iter = _legacy_entries()
     else:
         # Proper Croissant format: Files are referenced via FileSet
         # Enumerate files from the file system based on patterns
         print("Note: GeoCroissant uses FileSet structure. Enumerating files from filesystem...")
-        
-        # Get base path from FileObject distribution
-        base_path = ""
-        for dist in distribution:
-            if isinstance(dist, dict) and dist.get("@type") == "cr:FileObject":
-                base_path = dist.get("contentUrl", "")
-                break
-        
+
         # Extract regex patterns from image and mask fields
         image_pattern = None
         mask_pattern = None
@@ -204,77 +334,86 @@ def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path
             mask_pattern = transform.get("regex", ".*\\.mask\\.tif$")
         
         # Build absolute base path
-        if base_path.startswith("./") or base_path.startswith("../"):
+        if base_path.startswith(("./", "../")):
             # Relative path - resolve relative to the croissant file location
             croissant_dir = os.path.dirname(os.path.abspath(geocroissant_path))
             base_path = os.path.normpath(os.path.join(croissant_dir, base_path))
         
-        # Enumerate files matching the patterns
-        image_files = []
-        mask_files = []
-        
-        if os.path.exists(base_path):
-            # Walk through the directory
-            for root, dirs, files in os.walk(base_path):
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    rel_path = os.path.relpath(file_path, base_path)
-                    
+        # Enumerate files matching the patterns; suffix fast paths for the
+        # default patterns, precompiled regex otherwise
+        img_match = _pattern_matcher(image_pattern, _DEFAULT_IMAGE_PATTERN, '_merged.tif')
+        msk_match = _pattern_matcher(mask_pattern, _DEFAULT_MASK_PATTERN, '.mask.tif')
+
+        # Single dict keyed by base name: slot 0 image, slot 1 mask.
+        # Filled during the walk itself, so there are no intermediate
+        # image/mask lists, no sort passes, and no second pairing dict.
+        pairs = defaultdict(lambda: [None, None])
+        n_images = n_masks = 0
+
+        # No os.path.exists probe before the walk - that was an extra
+        # stat syscall and a check-then-use race; scandir itself raises
+        # when the base path is missing
+        missing = not base_path
+        if not missing:
+            # Anchor the walk at an absolute path so every entry.path the
+            # scan yields is already absolute and usable as-is; no
+            # relpath during the walk, no join when emitting. Skip the
+            # abspath (getcwd + normpath) when the path is already absolute.
+            if not os.path.isabs(base_path):
+                base_path = os.path.abspath(base_path)
+            file_iter = (_iter_files_threaded(base_path, concurrency)
+                         if concurrency > 1 else _iter_files(base_path))
+            try:
+                for filename, file_path in file_iter:
                     # Check if file matches image pattern
-                    if image_pattern and re.search(image_pattern, filename):
-                        image_files.append(rel_path)
-                    
+                    if img_match and img_match(filename):
+                        base_name = _MERGED_SUFFIX_RE.sub('', filename)
+                        pairs[base_name][0] = file_path
+                        n_images += 1
+
                     # Check if file matches mask pattern
-                    if mask_pattern and re.search(mask_pattern, filename):
-                        mask_files.append(rel_path)
-            
-            # Sort to ensure consistent ordering
-            image_files.sort()
-            mask_files.sort()
-            
-            print(f"Found {len(image_files)} image files and {len(mask_files)} mask files")
-            
+                    if msk_match and msk_match(filename):
+                        base_name = _MASK_SUFFIX_RE.sub('', filename)
+                        pairs[base_name][1] = file_path
+                        n_masks += 1
+            except (FileNotFoundError, NotADirectoryError):
+                missing = True
+
+        if not missing:
+            print(f"Found {n_images} image files and {n_masks} mask files")
+
             # Create data entries by pairing images with masks
             # Assuming paired naming: image ends with _merged.tif, mask ends with .mask.tif
-            # Extract base names and match them
-            image_base_map = {}
-            for img in image_files:
-                # Extract base name (remove _merged.tif suffix)
-                base_name = re.sub(r'_merged\.tif$', '', os.path.basename(img))
-                image_base_map[base_name] = img
-            
-            mask_base_map = {}
-            for msk in mask_files:
-                # Extract base name (remove .mask.tif suffix)
-                base_name = re.sub(r'\.mask\.tif$', '', os.path.basename(msk))
-                mask_base_map[base_name] = msk
-            
-            # Match images with masks
-            for idx, (base_name, img_rel_path) in enumerate(image_base_map.items()):
-                mask_rel_path = mask_base_map.get(base_name)
-                
-                if mask_rel_path:
-                    data_id = f"data_{idx}"
-                    img_full_path = os.path.join(base_path, img_rel_path)
-                    mask_full_path = os.path.join(base_path, mask_rel_path)
-                    
-                    labels = [AI_PixelLabel(
-                        type="AI_PixelLabel",
-                        image_url=[mask_full_path],
-                        image_format=["image/tiff"],
-                        class_=""
-                    )]
-                    
-                    data.append(AI_EOTrainingData(
-                        type="AI_EOTrainingData",
-                        id=data_id,
-                        data_url=[img_full_path],
-                        labels=labels
-                    ))
+            def _paired_entries():
+                # Bind the constructors to locals: LOAD_FAST instead of a
+                # global hash lookup per pair, which adds up at 10k+ pairs
+                _pixel_label = AI_PixelLabel
+                _training_data = AI_EOTrainingData
+                idx = 0
+                for img_path, mask_path in pairs.values():
+                    if img_path and mask_path:
+                        data_id = f"data_{idx}"
+                        idx += 1
+
+                        labels = [_pixel_label(
+                            type="AI_PixelLabel",
+                            image_url=[mask_path],
+                            image_format=["image/tiff"],
+                            class_=""
+                        )]
+
+                        yield _training_data(
+                            type="AI_EOTrainingData",
+                            id=data_id,
+                            data_url=[img_path],
+                            labels=labels
+                        )
+
+            data_iter = _paired_entries()
         else:
             print(f"Warning: Base path '{base_path}' does not exist. Creating placeholder entry.")
             # Create minimal data entry as placeholder
-            data.append(AI_EOTrainingData(
+            data_iter = iter([AI_EOTrainingData(
                 type="AI_EOTrainingData",
                 id="data_0",
                 data_url=[base_path or "./data"],
@@ -284,11 +423,14 @@ def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path
                     image_format=["image/tiff"],
                     class_=""
                 )]
-            ))
+            )])
 
-    # Ensure data is not empty
-    if not data:
+    # Ensure data is not empty without materializing the stream: pull the
+    # first entry, then chain it back in front of the iterator
+    first_entry = next(data_iter, None)
+    if first_entry is None:
         raise ValueError("No data entries found. The distribution field may be empty or not parsed correctly.")
+    data_iter = chain([first_entry], data_iter)
 
     # Build tasks
     tasks = [AI_EOTask(
@@ -301,33 +443,36 @@ def convert_geocroissant_to_tdml_objectmodel(geocroissant_path, tdml_output_path
         taskType="segmentation"
     )]
 
-    # Create EOTrainingDataset object
-    tdml_obj = EOTrainingDataset(
-        type="AI_EOTrainingDataset",
-        id=identifier,
-        name=name,
-        description=description,
-        license=license_,
-        providers=providers,
-        created_time=created_time,
-        updated_time=updated_time,
-        version=version,
-        tasks=tasks,
-        classes=classes,
-        bands=bands,
-        data=data,
-        extent=extent,
-        amount_of_training_data=len(data),
-        number_of_classes=len(classes)
-    )
-
-    # Write TDML JSON using pytdml
-    pytdml.io.write_to_json(tdml_obj, tdml_output_path)
-    print(f"TDML file written to {tdml_output_path}")
+    # Dataset-level fields, serialized through each pytdml object's
+    # camel-case to_dict so the output matches pytdml.io.write_to_json
+    header = {
+        "type": "AI_EOTrainingDataset",
+        "id": identifier,
+        "name": name,
+        "description": description,
+        "license": license_,
+        "providers": providers,
+        "createdTime": created_time,
+        "updatedTime": updated_time,
+        "version": version,
+        "tasks": [task.to_dict() for task in tasks],
+        "classes": [c.to_dict() for c in classes],
+        "bands": [band.to_dict() for band in bands],
+        "extent": extent,
+        "numberOfClasses": len(classes),
+    }
+
+    # Stream the document; the data array is written entry by entry and
+    # counted as it goes instead of being collected into a list first
+    n_data = _write_tdml_streaming(tdml_output_path, header, data_iter)
+    print(f"TDML file written to {tdml_output_path} ({n_data} data entries)")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Convert GeoCroissant JSON to TDML JSON using pytdml object model.")
     parser.add_argument("geocroissant_path", help="Path to input GeoCroissant JSON")
     parser.add_argument("tdml_output_path", help="Path to output TDML JSON")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Directory-scan threads; raise above 1 for network filesystems")
     args = parser.parse_args()
-    convert_geocroissant_to_tdml_objectmodel(args.geocroissant_path, args.tdml_output_path) 
+    convert_geocroissant_to_tdml_objectmodel(args.geocroissant_path, args.tdml_output_path,
+                                             concurrency=args.concurrency)
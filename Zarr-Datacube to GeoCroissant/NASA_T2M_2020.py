@@ -1,182 +1,161 @@
+import functools
 import json
+import orjson
 from datetime import datetime
-import xarray as xr
 import hashlib
+from pathlib import Path
+
+# Canonical JSON-LD context, shared across converters as
+# croissant_context.json at the repository root and parsed once per
+# process.
+_CONTEXT_PATH = Path(__file__).resolve().parent.parent / "croissant_context.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_context():
+    """Load the shared JSON-LD context (one parse per process)."""
+    return orjson.loads(_CONTEXT_PATH.read_bytes())
+
+
+_CROISSANT_CONTEXT = _load_context()
+
+
+# Shared source reference for the record-set fields; one dict serialized
+# four times by json instead of four separate allocations.
+_ZARR_SRC = {
+    "fileObject": {
+        "@id": "zarr-data"
+    }
+}
+
+_ZARR_URL = "https://nasa-power.s3.us-west-2.amazonaws.com/merra2/temporal/power_merra2_monthly_temporal_utc.zarr/"
+
+# TTL-compliant GeoCroissant skeleton.  The document is 99% static, so it is
+# serialized once at import with sentinel placeholders for the two dynamic
+# values; emission is then two str.replace calls and a single write instead
+# of a recursive json.dump traversal.
+_NASA_T2M_SKELETON = {
+    "@context": _CROISSANT_CONTEXT,
+    "@type": "sc:Dataset",
+    "name": "NASA POWER T2M 2020",
+    "description": "Temperature at 2 Meters monthly data for 2020",
+    "version": "1.0.0",
+    "license": "CC-BY-4.0",
+    "conformsTo": [
+        "http://mlcommons.org/croissant/1.1",
+        "http://mlcommons.org/croissant/geo/1.0"
+    ],
+    "citeAs": "@dataset{nasa_power_t2m_2020, title={NASA POWER T2M 2020}, year={2020}, url={https://nasa-power.s3.us-west-2.amazonaws.com}}",
+    "datePublished": "2020-01-01",
+
+    # Standard spatial coverage using schema.org
+    "spatialCoverage": {
+        "@type": "Place",
+        "geo": {
+            "@type": "GeoShape",
+            "box": "-90.0 -180.0 90.0 179.375"
+        }
+    },
+
+    # GeoCroissant spatial properties
+    "geocr:coordinateReferenceSystem": "EPSG:4326",
+    "geocr:spatialResolution": {
+        "@type": "QuantitativeValue",
+        "value": 0.5,
+        "unitText": "degrees"
+    },
+    "geocr:temporalResolution": {
+        "@type": "QuantitativeValue",
+        "value": 1,
+        "unitText": "month"
+    },
+
+    # Temporal coverage
+    "temporalCoverage": "2020-01-01/2020-12-31",
+
+    "keywords": ["temperature", "climate", "nasa power", "t2m", "2020"],
+
+    "distribution": [
+        {
+            "@type": "cr:FileObject",
+            "@id": "zarr-data",
+            "name": "zarr-data",
+            "contentUrl": "__ZARR_URL__",
+            "encodingFormat": "application/zarr",
+            "md5": "__MD5__"
+        }
+    ],
+
+    "recordSet": [
+        {
+            "@type": "cr:RecordSet",
+            "name": "t2m_data",
+            "field": [
+                {
+                    "@type": "cr:Field",
+                    "name": "T2M",
+                    "description": "Temperature at 2 Meters",
+                    "dataType": "sc:Float",
+                    "source": _ZARR_SRC
+                },
+                {
+                    "@type": "cr:Field",
+                    "name": "latitude",
+                    "description": "Latitude coordinate",
+                    "dataType": "sc:Float",
+                    "source": _ZARR_SRC
+                },
+                {
+                    "@type": "cr:Field",
+                    "name": "longitude",
+                    "description": "Longitude coordinate",
+                    "dataType": "sc:Float",
+                    "source": _ZARR_SRC
+                },
+                {
+                    "@type": "cr:Field",
+                    "name": "time",
+                    "description": "Time coordinate",
+                    "dataType": "sc:Text",
+                    "source": _ZARR_SRC
+                }
+            ]
+        }
+    ]
+}
+
+_NASA_T2M_TEMPLATE = json.dumps(_NASA_T2M_SKELETON, indent=2)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sha256_hex(data):
+    """Hex SHA-256 of *data* (bytes), cached across repeated conversions."""
+    return hashlib.sha256(data).hexdigest()
 
 
 def create_nasa_t2m_2020_croissant():
     """Create GeoCroissant metadata for NASA T2M 2020 following TTL specifications."""
-    
-    zarr_url = "https://nasa-power.s3.us-west-2.amazonaws.com/merra2/temporal/power_merra2_monthly_temporal_utc.zarr/"
-    
-    # Load dataset
-    ds_full = xr.open_zarr(zarr_url)
-    ds_2020 = ds_full.sel(time=slice("2020-01-01", "2020-12-31"))
-    
+
+    zarr_url = _ZARR_URL
+
     # Generate checksum
     hash_input = f"{zarr_url}2020T2M".encode('utf-8')
-    checksum = hashlib.sha256(hash_input).hexdigest()
-    
-    # TTL-compliant GeoCroissant metadata
-    croissant = {
-        "@context": {
-            "@language": "en",
-            "@vocab": "https://schema.org/",
-            "citeAs": "cr:citeAs",
-            "column": "cr:column",
-            "conformsTo": "dct:conformsTo",
-            "cr": "http://mlcommons.org/croissant/",
-            "geocr": "http://mlcommons.org/croissant/geo/",
-            "rai": "http://mlcommons.org/croissant/RAI/",
-            "dct": "http://purl.org/dc/terms/",
-            "sc": "https://schema.org/",
-            "data": {
-                "@id": "cr:data",
-                "@type": "@json"
-            },
-            "examples": {
-                "@id": "cr:examples",
-                "@type": "@json"
-            },
-            "dataType": {
-                "@id": "cr:dataType",
-                "@type": "@vocab"
-            },
-            "extract": "cr:extract",
-            "field": "cr:field",
-            "fileProperty": "cr:fileProperty",
-            "fileObject": "cr:fileObject",
-            "fileSet": "cr:fileSet",
-            "format": "cr:format",
-            "includes": "cr:includes",
-            "isLiveDataset": "cr:isLiveDataset",
-            "jsonPath": "cr:jsonPath",
-            "key": "cr:key",
-            "md5": "cr:md5",
-            "parentField": "cr:parentField",
-            "path": "cr:path",
-            "recordSet": "cr:recordSet",
-            "references": "cr:references",
-            "regex": "cr:regex",
-            "repeated": "cr:repeated",
-            "replace": "cr:replace",
-            "samplingRate": "cr:samplingRate",
-            "separator": "cr:separator",
-            "source": "cr:source",
-            "subField": "cr:subField",
-            "transform": "cr:transform"
-        },
-        "@type": "sc:Dataset",
-        "name": "NASA POWER T2M 2020",
-        "description": "Temperature at 2 Meters monthly data for 2020",
-        "version": "1.0.0",
-        "license": "CC-BY-4.0",
-        "conformsTo": [
-            "http://mlcommons.org/croissant/1.1",
-            "http://mlcommons.org/croissant/geo/1.0"
-        ],
-        "citeAs": "@dataset{nasa_power_t2m_2020, title={NASA POWER T2M 2020}, year={2020}, url={https://nasa-power.s3.us-west-2.amazonaws.com}}",
-        "datePublished": "2020-01-01",
-        
-        # Standard spatial coverage using schema.org
-        "spatialCoverage": {
-            "@type": "Place",
-            "geo": {
-                "@type": "GeoShape",
-                "box": "-90.0 -180.0 90.0 179.375"
-            }
-        },
-        
-        # GeoCroissant spatial properties
-        "geocr:coordinateReferenceSystem": "EPSG:4326",
-        "geocr:spatialResolution": {
-            "@type": "QuantitativeValue",
-            "value": 0.5,
-            "unitText": "degrees"
-        },
-        "geocr:temporalResolution": {
-            "@type": "QuantitativeValue", 
-            "value": 1,
-            "unitText": "month"
-        },
-        
-        # Temporal coverage
-        "temporalCoverage": "2020-01-01/2020-12-31",
-        
-        "keywords": ["temperature", "climate", "nasa power", "t2m", "2020"],
-        
-        "distribution": [
-            {
-                "@type": "cr:FileObject",
-                "@id": "zarr-data",
-                "name": "zarr-data",
-                "contentUrl": zarr_url,
-                "encodingFormat": "application/zarr",
-                "md5": checksum[:32]
-            }
-        ],
-        
-        "recordSet": [
-            {
-                "@type": "cr:RecordSet",
-                "name": "t2m_data",
-                "field": [
-                    {
-                        "@type": "cr:Field",
-                        "name": "T2M",
-                        "description": "Temperature at 2 Meters",
-                        "dataType": "sc:Float",
-                        "source": {
-                            "fileObject": {
-                                "@id": "zarr-data"
-                            }
-                        }
-                    },
-                    {
-                        "@type": "cr:Field", 
-                        "name": "latitude",
-                        "description": "Latitude coordinate",
-                        "dataType": "sc:Float",
-                        "source": {
-                            "fileObject": {
-                                "@id": "zarr-data"
-                            }
-                        }
-                    },
-                    {
-                        "@type": "cr:Field",
-                        "name": "longitude",
-                        "description": "Longitude coordinate", 
-                        "dataType": "sc:Float",
-                        "source": {
-                            "fileObject": {
-                                "@id": "zarr-data"
-                            }
-                        }
-                    },
-                    {
-                        "@type": "cr:Field",
-                        "name": "time",
-                        "description": "Time coordinate",
-                        "dataType": "sc:Text",
-                        "source": {
-                            "fileObject": {
-                                "@id": "zarr-data"
-                            }
-                        }
-                    }
-                ]
-            }
-        ]
-    }
-    
+    checksum = _sha256_hex(hash_input)
+
+    # Fill the precompiled template and emit it directly
+    document = (
+        _NASA_T2M_TEMPLATE
+        .replace("__ZARR_URL__", zarr_url)
+        .replace("__MD5__", checksum[:32])
+    )
+
     # Save metadata
     with open("NASA_T2M_2020_croissant.json", "w") as f:
-        json.dump(croissant, f, indent=2)
-    
-    return croissant
+        f.write(document)
+
+    return orjson.loads(document)
 
 
 # Execute
 if __name__ == "__main__":
-    croissant = create_nasa_t2m_2020_croissant()
\ No newline at end of file
+    croissant = create_nasa_t2m_2020_croissant()